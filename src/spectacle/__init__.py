@@ -4,9 +4,18 @@ from manim import *
 
 from .physics.feynman.particles import *
 from .physics.feynman.layout import *
+from .physics.feynman.schedule import *
+from .physics.feynman.graph import *
+from .physics.feynman.enumeration import *
+from .physics.relativity.causality import *
 from .physics.relativity.spacetime import *
+from .manim_extension.animation.creation import *
 from .manim_extension.mobject.coordinate_systems import *
+from .manim_extension.mobject.flatten import *
 from .manim_extension.mobject.geometry import *
+from .manim_extension.mobject.serialization import *
+from .manim_extension.mobject.svg_export import *
+from .manim_extension.mobject.tex_mobject import *
 from .manim_extension.utils.color import *
 from .manim_extension.utils.paths import *
 
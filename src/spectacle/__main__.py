@@ -1,4 +1,8 @@
 #!/usr/bin/env python
 
+import sys
+
+from .cli import main
+
 if __name__ == "__main__":
-    print("no available script yet")
+    sys.exit(main())
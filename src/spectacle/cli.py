@@ -0,0 +1,152 @@
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import importlib
+import importlib.util
+import inspect
+import os
+from pathlib import Path
+import sys
+import time
+from types import ModuleType
+from typing import Dict, List, Optional, Sequence, Tuple
+from manim import Scene, tempconfig
+
+DEFAULT_TARGETS = ["spectacle.physics.feynman.__gallery__"]
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def load_module(target: str) -> ModuleType:
+    path = Path(target)
+    if path.suffix != ".py":
+        return importlib.import_module(target)
+
+    # Demo scripts live outside the package, so they are loaded from their file like manim does.
+    name = f"spectacle_scenes.{path.stem}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def expand_targets(targets: Sequence[str]) -> List[str]:
+    expanded = []
+    for target in targets:
+        path = Path(target)
+        if path.is_dir():
+            expanded += sorted(str(file) for file in path.glob("*.py"))
+        else:
+            expanded.append(target)
+    return expanded
+
+
+def discover_scenes(target: str) -> List[str]:
+    module = load_module(target)
+    return [
+        name
+        for name, member in inspect.getmembers(module, inspect.isclass)
+        if issubclass(member, Scene) and member.__module__ == module.__name__
+    ]
+
+
+def render_scene(target: str, scene_name: str, quality: str) -> Tuple[float, Optional[str]]:
+    start = time.perf_counter()
+    try:
+        scene_class = getattr(load_module(target), scene_name)
+        with tempconfig({"quality": quality, "progress_bar": "none", "verbosity": "WARNING"}):
+            scene_class().render()
+    except Exception as error:  # a failing scene should not take the rest of the batch down
+        return time.perf_counter() - start, f"{type(error).__name__}: {error}"
+    return time.perf_counter() - start, None
+
+
+def parse_scene_qualities(values: Sequence[str]) -> Dict[str, str]:
+    qualities = {}
+    for value in values:
+        scene_name, _, quality = value.partition("=")
+        qualities[scene_name] = QUALITIES.get(quality, quality)
+    return qualities
+
+
+def get_parser() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="spectacle",
+        description="Render every Scene found in modules, scene files or directories of them.",
+    )
+    parser.add_argument(
+        "targets",
+        nargs="*",
+        default=DEFAULT_TARGETS,
+        help="dotted module names, .py files or directories (default: the Feynman gallery)",
+    )
+    parser.add_argument(
+        "-s", "--scene", action="append", default=[], help="only render scenes with this name"
+    )
+    parser.add_argument(
+        "-q",
+        "--quality",
+        default="l",
+        help="default quality: l, m, h, p, k or a manim quality name (default: l)",
+    )
+    parser.add_argument(
+        "--scene-quality",
+        action="append",
+        default=[],
+        metavar="SCENE=QUALITY",
+        help="override the quality of one scene; may be repeated",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of scenes rendered in parallel (default: number of CPUs)",
+    )
+    parser.add_argument("--list", action="store_true", help="list the scenes and exit")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = get_parser().parse_args(argv)
+    default_quality = QUALITIES.get(args.quality, args.quality)
+    scene_qualities = parse_scene_qualities(args.scene_quality)
+
+    jobs = [
+        (target, scene_name, scene_qualities.get(scene_name, default_quality))
+        for target in expand_targets(args.targets)
+        for scene_name in discover_scenes(target)
+        if len(args.scene) == 0 or scene_name in args.scene
+    ]
+
+    if args.list:
+        for target, scene_name, quality in jobs:
+            print(f"{target}:{scene_name} ({quality})")
+        return 0
+
+    failures = 0
+    batch_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(jobs) or 1))) as executor:
+        futures = {executor.submit(render_scene, *job): job for job in jobs}
+        for future in as_completed(futures):
+            target, scene_name, quality = futures[future]
+            seconds, error = future.result()
+            status = "ok" if error is None else f"FAILED {error}"
+            failures += error is not None
+            print(f"{seconds:8.2f}s  {scene_name} ({quality}, {target})  {status}", flush=True)
+
+    print(
+        f"Rendered {len(jobs) - failures}/{len(jobs)} scenes "
+        f"in {time.perf_counter() - batch_start:.2f}s"
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+from typing import Dict, List, Tuple
+from manim import *
+
+
+def get_style_key(vmobject: VMobject) -> tuple:
+    stroke_rgbas = vmobject.get_stroke_rgbas()
+    fill_rgbas = vmobject.get_fill_rgbas()
+    background_rgbas = vmobject.get_stroke_rgbas(background=True)
+
+    # Gradients are laid out across each mobject's own extent, so they can not be shared.
+    for rgbas in [stroke_rgbas, fill_rgbas, background_rgbas]:
+        if len(np.unique(rgbas, axis=0)) > 1:
+            return (id(vmobject),)
+
+    return (
+        tuple(np.round(stroke_rgbas[0], 6)),
+        tuple(np.round(fill_rgbas[0], 6)),
+        tuple(np.round(background_rgbas[0], 6)),
+        vmobject.get_stroke_width(),
+        vmobject.get_stroke_width(background=True),
+        vmobject.get_sheen_factor(),
+    )
+
+
+class StyleBatchedVGroup(VGroup):
+    """Merges every leaf of a mobject tree that shares a style into one multi-subpath VMobject.
+
+    Each batch is drawn with a single stroke and fill, so a diagram with dozens of particles
+    renders with one draw call per distinct style. The original tree is kept as :attr:`source`,
+    and every leaf remembers the slice of its batch's points it was copied into, so logical
+    particles can still be located or animated through :meth:`get_batch_slices` and
+    :meth:`sync`.
+
+    Parameters
+    ----------
+    mobject
+        The tree to flatten. It is not modified.
+    kwargs : Any
+        Additional arguments to be passed to :class:`VGroup`.
+
+    .. note::
+
+        Batches are drawn in order of their first leaf, so overlapping leaves of different styles
+        may change their stacking order.
+    """
+
+    def __init__(self, mobject: Mobject, **kwargs):
+        self.source = mobject
+        self.leaves: List[VMobject] = []
+        self.leaf_slices: List[Tuple[VMobject, slice]] = []
+        super().__init__(**kwargs)
+
+        batches: Dict[tuple, List[VMobject]] = {}
+        for leaf in mobject.family_members_with_points():
+            if isinstance(leaf, VMobject):
+                batches.setdefault(get_style_key(leaf), []).append(leaf)
+
+        for leaves in batches.values():
+            batch = VMobject().match_style(leaves[0])
+            batch.set_points(np.concatenate([leaf.points for leaf in leaves]))
+            offset = 0
+            for leaf in leaves:
+                self.leaves.append(leaf)
+                self.leaf_slices.append((batch, slice(offset, offset + len(leaf.points))))
+                offset += len(leaf.points)
+            self.add(batch)
+
+    def get_batch_slices(self, mobject: Mobject) -> List[Tuple[VMobject, slice]]:
+        members = {id(member) for member in mobject.get_family()}
+        return [
+            leaf_slice
+            for leaf, leaf_slice in zip(self.leaves, self.leaf_slices)
+            if id(leaf) in members
+        ]
+
+    def sync(self, *mobjects: Mobject):
+        """Copies the current points of the given logical mobjects (default: all) into their
+        batches. Their point counts must not have changed since flattening."""
+        members = {id(member) for mobject in mobjects for member in mobject.get_family()}
+        for leaf, (batch, index) in zip(self.leaves, self.leaf_slices):
+            if len(mobjects) == 0 or id(leaf) in members:
+                batch.points[index] = leaf.points
+        return self
+
+
+def flatten_by_style(mobject: Mobject) -> StyleBatchedVGroup:
+    return StyleBatchedVGroup(mobject)
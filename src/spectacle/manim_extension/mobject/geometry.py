@@ -11,17 +11,7 @@ class WavyLine(VMobject, metaclass=ConvertToOpenGL):
         self.add_curves(start, end, waves, width)
 
     def add_curves(self, start, end, waves, width):
-        for u in range(waves):
-            vec = end - start
-            one_wavelength = get_wavy_curve_points(
-                start=start + vec * (u / waves),
-                end=start + vec * ((u + 1) / waves),
-                width=width,
-            )
-            if u == 0:
-                self.add_cubic_bezier_curve(*one_wavelength)
-            else:
-                self.add_cubic_bezier_curve_to(*one_wavelength[1:])
+        self.set_points(get_wavy_curves_points(start, end, waves, width))
 
     def get_angle(self):
         return self.base_line.get_angle()
@@ -0,0 +1,220 @@
+from functools import lru_cache
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+import inspect
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from manim import *
+from ..animation.creation import BatchedCreate
+
+MOBJECT_CACHE_VERSION = 1
+
+STYLE_ARRAYS = ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "sheen_direction"]
+STYLE_VALUES = ["stroke_width", "background_stroke_width", "sheen_factor", "z_index"]
+
+SerializedMobject = Tuple[dict, List[np.ndarray]]
+
+_loaded_mobjects: Dict[str, SerializedMobject] = {}
+
+
+def get_mobject_cache_dir() -> Path:
+    return Path(config.get_dir("media_dir")) / "mobjects"
+
+
+def get_package_version() -> str:
+    try:
+        return version("spectacle")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+@lru_cache(maxsize=None)
+def get_package_source_hash() -> str:
+    """Hashes every source file of the package, so that cached geometry is rebuilt after any edit
+    to the layouts or particles it was built from."""
+    digest = sha256()
+    package_dir = Path(__file__).resolve().parents[2]
+    for path in sorted(package_dir.rglob("*.py")):
+        digest.update(path.relative_to(package_dir).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_builder_source(builder: Callable[..., Mobject]) -> str:
+    try:
+        return inspect.getsource(builder)
+    except (OSError, TypeError):
+        return ""
+
+
+def _to_json(value: Any):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def get_mobject_cache_key(builder: Callable[..., Mobject], *args, **kwargs) -> str:
+    spec = json.dumps(
+        {
+            "version": MOBJECT_CACHE_VERSION,
+            "package_version": get_package_version(),
+            "package_source": get_package_source_hash(),
+            "builder": f"{builder.__module__}.{builder.__qualname__}",
+            "builder_source": sha256(get_builder_source(builder).encode("utf-8")).hexdigest(),
+            "args": args,
+            "kwargs": kwargs,
+        },
+        sort_keys=True,
+        default=_to_json,
+    )
+    return sha256(spec.encode("utf-8")).hexdigest()
+
+
+def get_interact_stages(mobject: Mobject) -> List[List[Mobject]]:
+    if not hasattr(mobject, "interact_animations"):
+        return []
+    return [
+        list(animation.mobject.submobjects)
+        if isinstance(animation, BatchedCreate)
+        else [animation.mobject]
+        for animation in mobject.interact_animations()
+    ]
+
+
+def serialize_mobject(
+    mobject: Mobject, stages: Sequence[Sequence[Mobject]] = ()
+) -> SerializedMobject:
+    """Flattens a tree of :class:`VMobject` into its point arrays and a JSON-compatible structure.
+
+    Nodes are listed in pre-order, each with the index of its parent, its style and the index of
+    its point array. ``stages`` are stored as lists of node indices.
+    """
+    nodes: List[dict] = []
+    points: List[np.ndarray] = []
+    node_index: Dict[int, int] = {}
+
+    def visit(node: Mobject, parent: int):
+        if not isinstance(node, VMobject):
+            raise Exception(f"Can not serialize {type(node).__name__}, only VMobjects")
+        node_index.setdefault(id(node), len(nodes))
+        entry = {"parent": parent, "points": -1}
+        entry.update({name: getattr(node, name).tolist() for name in STYLE_ARRAYS})
+        entry.update({name: _to_json(getattr(node, name)) for name in STYLE_VALUES})
+        if len(node.points) > 0:
+            entry["points"] = len(points)
+            points.append(node.points.copy())
+        nodes.append(entry)
+
+        index = len(nodes) - 1
+        for submobject in node.submobjects:
+            visit(submobject, index)
+
+    visit(mobject, -1)
+    structure = {
+        "version": MOBJECT_CACHE_VERSION,
+        "nodes": nodes,
+        "stages": [[node_index[id(member)] for member in stage] for stage in stages],
+    }
+    return structure, points
+
+
+class SerializedVGroup(VGroup):
+    """A mobject tree rebuilt from :func:`serialize_mobject` output without running any of the
+    original constructors.
+
+    Every node becomes a plain :class:`VMobject` (if it had points) or :class:`VGroup` with the
+    saved points and style, so the geometry matches the original exactly. Animation stages are
+    kept, so :meth:`interact_animations` plays like the original layout.
+    """
+
+    def __init__(self, structure: dict, points: Sequence[np.ndarray], **kwargs):
+        super().__init__(**kwargs)
+        nodes: List[VMobject] = []
+        for entry in structure["nodes"]:
+            if entry["parent"] < 0:
+                node = self
+            elif entry["points"] >= 0:
+                node = VMobject()
+            else:
+                node = VGroup()
+            if entry["points"] >= 0:
+                node.set_points(points[entry["points"]].copy())
+            for name in STYLE_ARRAYS:
+                setattr(node, name, np.array(entry[name], dtype=float))
+            for name in STYLE_VALUES:
+                setattr(node, name, entry[name])
+            if entry["parent"] >= 0:
+                nodes[entry["parent"]].add(node)
+            nodes.append(node)
+
+        self.stages = [[nodes[index] for index in stage] for stage in structure["stages"]]
+
+    def interact_animations(self):
+        return [BatchedCreate(*stage) for stage in self.stages]
+
+
+def save_mobject(key: str, mobject: Mobject, stages: Sequence[Sequence[Mobject]] = ()):
+    structure, points = serialize_mobject(mobject, stages)
+    cache_dir = get_mobject_cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # The JSON file is written last, so its presence means the archive is complete. Both go
+    # through a private file first so concurrent renders never read a partial one.
+    temp_path = cache_dir / f"{key}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        np.savez(
+            file,
+            points=np.concatenate(points) if points else np.zeros((0, 3)),
+            point_offsets=np.cumsum([0, *[len(array) for array in points]]),
+        )
+    os.replace(temp_path, cache_dir / f"{key}.npz")
+
+    temp_path.write_text(json.dumps(structure), encoding="utf-8")
+    os.replace(temp_path, cache_dir / f"{key}.json")
+    _loaded_mobjects[key] = (structure, points)
+
+
+def load_mobject(key: str) -> Optional[SerializedVGroup]:
+    if key not in _loaded_mobjects:
+        path = get_mobject_cache_dir() / key
+        if not path.with_suffix(".json").exists():
+            return None
+        structure = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+        if structure["version"] != MOBJECT_CACHE_VERSION:
+            return None
+        with np.load(path.with_suffix(".npz")) as data:
+            all_points, offsets = data["points"], data["point_offsets"]
+        points = [all_points[a:b] for a, b in zip(offsets[:-1], offsets[1:])]
+        _loaded_mobjects[key] = (structure, points)
+    return SerializedVGroup(*_loaded_mobjects[key])
+
+
+def get_cached_mobject(builder: Callable[..., Mobject], *args, **kwargs) -> VMobject:
+    """Builds ``builder(*args, **kwargs)`` once and reloads its geometry from disk afterwards.
+
+    The cache is keyed by the builder and its source, its arguments, and the version and source
+    of the package, so editing the builder or any layout or particle code invalidates it. The
+    first call returns the freshly built mobject; every later call, in this process or any other,
+    returns a :class:`SerializedVGroup` with the same points, styles and animation stages.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        diagram = get_cached_mobject(ProtonConfinement)
+        for animation in diagram.interact_animations():
+            self.play(animation)
+    """
+    key = get_mobject_cache_key(builder, *args, **kwargs)
+    mobject = load_mobject(key)
+    if mobject is None:
+        mobject = builder(*args, **kwargs)
+        save_mobject(key, mobject, get_interact_stages(mobject))
+    return mobject
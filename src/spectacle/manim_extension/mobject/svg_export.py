@@ -0,0 +1,163 @@
+from pathlib import Path
+from typing import List, Optional, Tuple
+from manim import *
+
+# Cairo draws stroke widths in hundredths of a scene unit.
+SVG_STROKE_WIDTH_MULTIPLE = 0.01
+
+
+def _format(values: np.ndarray, decimals: int) -> str:
+    return " ".join(f"{value:.{decimals}f}".rstrip("0").rstrip(".") for value in values)
+
+
+def get_svg_path_data(points: np.ndarray, decimals=3) -> str:
+    """Returns the SVG path data of cubic Bézier points laid out as manim stores them.
+
+    A new subpath starts wherever a curve does not begin at the end of the previous one, and a
+    subpath that ends where it started is closed, as the Cairo camera does. The y axis is flipped
+    to match SVG.
+    """
+    curves = points[: len(points) - len(points) % 4].reshape(-1, 4, 3)[:, :, :2] * [1, -1] + 0.0
+    if len(curves) == 0:
+        return ""
+
+    breaks = np.flatnonzero(np.linalg.norm(curves[1:, 0] - curves[:-1, 3], axis=1) > 1e-6) + 1
+    commands = []
+    for subpath in np.split(curves, breaks):
+        commands.append(f"M {_format(subpath[0, 0], decimals)}")
+        commands.append(f"C {_format(subpath[:, 1:].ravel(), decimals)}")
+        if np.linalg.norm(subpath[0, 0] - subpath[-1, 3]) <= 1e-6:
+            commands.append("Z")
+    return " ".join(commands)
+
+
+def get_svg_paint(
+    name: str, vmobject: VMobject, rgbas: np.ndarray, gradient_id: str, decimals=3
+) -> Tuple[str, Optional[str]]:
+    """Returns the ``fill`` or ``stroke`` attributes of ``rgbas``, and the definition of the
+    linear gradient they refer to when there is more than one color."""
+    if len(rgbas) == 0 or np.all(rgbas[:, 3] == 0):
+        return f'{name}="none"', None
+    if len(rgbas) == 1:
+        return f'{name}="{rgb_to_hex(rgbas[0, :3])}" {name}-opacity="{rgbas[0, 3]:g}"', None
+
+    # Cairo spreads the colors evenly between the gradient's start and end points.
+    start, end = np.array(vmobject.get_gradient_start_and_end_points())[:, :2] * [1, -1]
+    stops = "".join(
+        f'<stop offset="{offset:g}" stop-color="{rgb_to_hex(rgba[:3])}" '
+        f'stop-opacity="{rgba[3]:g}"/>'
+        for offset, rgba in zip(np.linspace(0, 1, len(rgbas)), rgbas)
+    )
+    definition = (
+        f'<linearGradient id="{gradient_id}" gradientUnits="userSpaceOnUse" '
+        f'x1="{start[0]:.{decimals}f}" y1="{start[1]:.{decimals}f}" '
+        f'x2="{end[0]:.{decimals}f}" y2="{end[1]:.{decimals}f}">{stops}</linearGradient>'
+    )
+    return f'{name}="url(#{gradient_id})"', definition
+
+
+def get_svg_elements(vmobject: VMobject, index: int, decimals=3) -> Tuple[List[str], List[str]]:
+    """Returns the gradient definitions and ``<path>`` elements of one leaf: its background
+    stroke, then its fill and stroke, in the order Cairo paints them."""
+    path_data = get_svg_path_data(vmobject.points, decimals)
+    if path_data == "":
+        return [], []
+
+    definitions: List[str] = []
+    elements: List[str] = []
+    for background in [True, False]:
+        suffix = "b" if background else ""
+        width = vmobject.get_stroke_width(background=background) * SVG_STROKE_WIDTH_MULTIPLE
+        if background:
+            fill = 'fill="none"'
+        else:
+            fill, definition = get_svg_paint(
+                "fill", vmobject, vmobject.get_fill_rgbas(), f"fill{index}", decimals
+            )
+            definitions += [definition] if definition is not None else []
+
+        stroke = 'stroke="none"'
+        if width > 0:
+            stroke, definition = get_svg_paint(
+                "stroke",
+                vmobject,
+                vmobject.get_stroke_rgbas(background=background),
+                f"stroke{index}{suffix}",
+                decimals,
+            )
+            definitions += [definition] if definition is not None else []
+            stroke += f' stroke-width="{width:g}"'
+
+        if fill != 'fill="none"' or stroke != 'stroke="none"':
+            elements.append(f'<path d="{path_data}" {fill} {stroke}/>')
+    return definitions, elements
+
+
+def mobject_to_svg(
+    mobject: Mobject,
+    buff=0.25,
+    pixels_per_unit=100,
+    background_color: Optional[str] = None,
+    decimals=3,
+) -> str:
+    """Renders a mobject tree straight to an SVG document, without a scene, camera or frame.
+
+    Every :class:`VMobject` leaf becomes one ``<path>`` holding all of its Bézier subpaths, drawn
+    in ``z_index`` order with its fill, stroke, background stroke and color gradients, so the
+    picture matches the last frame the Cairo renderer would draw of the same mobject.
+
+    Parameters
+    ----------
+    mobject
+        The tree to export, for example a :class:`TwoVertexLayout`.
+    buff
+        The margin around the mobject, in scene units.
+    pixels_per_unit
+        The size of one scene unit in the document's width and height.
+    background_color
+        The color of a rectangle drawn behind the mobject; transparent by default.
+    decimals
+        The number of decimals written for each coordinate.
+    """
+    leaves = sorted(
+        [leaf for leaf in mobject.family_members_with_points() if isinstance(leaf, VMobject)],
+        key=lambda leaf: leaf.z_index,
+    )
+
+    definitions: List[str] = []
+    elements: List[str] = []
+    for index, leaf in enumerate(leaves):
+        leaf_definitions, leaf_elements = get_svg_elements(leaf, index, decimals)
+        definitions += leaf_definitions
+        elements += leaf_elements
+
+    points = np.concatenate([leaf.points for leaf in leaves]) if leaves else np.zeros((1, 3))
+    points = points[:, :2] * [1, -1]
+    x, y = points.min(axis=0) - buff
+    width, height = points.max(axis=0) - points.min(axis=0) + 2 * buff
+
+    if background_color is not None:
+        elements.insert(
+            0,
+            f'<rect x="{x:g}" y="{y:g}" width="{width:g}" height="{height:g}" '
+            f'fill="{rgb_to_hex(color_to_rgb(background_color))}"/>',
+        )
+
+    return "\n".join(
+        [
+            f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'width="{width * pixels_per_unit:g}" height="{height * pixels_per_unit:g}" '
+            f'viewBox="{x:g} {y:g} {width:g} {height:g}">',
+            f"<defs>{''.join(definitions)}</defs>",
+            *elements,
+            "</svg>",
+            "",
+        ]
+    )
+
+
+def save_svg(mobject: Mobject, path, **kwargs) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(mobject_to_svg(mobject, **kwargs), encoding="utf-8")
+    return path
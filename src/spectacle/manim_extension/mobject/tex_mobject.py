@@ -0,0 +1,184 @@
+from hashlib import sha256
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+import manim
+from manim import *
+
+TEX_GLYPH_CACHE_VERSION = 1
+
+TexGlyphs = List[List[np.ndarray]]
+
+_loaded_tex_glyphs: Dict[str, TexGlyphs] = {}
+
+
+def get_tex_glyph_cache_dir() -> Path:
+    return Path(config.get_dir("tex_dir")) / "glyphs"
+
+
+def get_tex_glyph_key(
+    tex_strings: Sequence[str], tex_environment="align*", tex_template=None
+) -> str:
+    tex_template = tex_template if tex_template is not None else config.tex_template
+    spec = json.dumps(
+        {
+            "version": TEX_GLYPH_CACHE_VERSION,
+            "manim_version": manim.__version__,
+            "tex_strings": list(tex_strings),
+            "tex_environment": tex_environment,
+            "tex_template": tex_template.body,
+            "tex_compiler": tex_template.tex_compiler,
+            "output_format": tex_template.output_format,
+        },
+        sort_keys=True,
+    )
+    return sha256(spec.encode("utf-8")).hexdigest()
+
+
+def load_tex_glyphs(key: str) -> Optional[TexGlyphs]:
+    if key in _loaded_tex_glyphs:
+        return _loaded_tex_glyphs[key]
+
+    path = get_tex_glyph_cache_dir() / f"{key}.npz"
+    if not path.exists():
+        return None
+
+    with np.load(path) as data:
+        points, glyph_offsets = data["points"], data["glyph_offsets"]
+        glyphs = [points[a:b] for a, b in zip(glyph_offsets[:-1], glyph_offsets[1:])]
+        part_offsets = np.cumsum([0, *data["part_sizes"]])
+    parts = [glyphs[a:b] for a, b in zip(part_offsets[:-1], part_offsets[1:])]
+    _loaded_tex_glyphs[key] = parts
+    return parts
+
+
+def save_tex_glyphs(key: str, parts: TexGlyphs):
+    glyphs = [glyph for part in parts for glyph in part]
+    cache_dir = get_tex_glyph_cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # Write to a private file first so concurrent renders never read a partial archive.
+    path = cache_dir / f"{key}.npz"
+    temp_path = cache_dir / f"{key}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        np.savez(
+            file,
+            points=np.concatenate(glyphs) if glyphs else np.zeros((0, 3)),
+            glyph_offsets=np.cumsum([0, *[len(glyph) for glyph in glyphs]]),
+            part_sizes=np.array([len(part) for part in parts]),
+        )
+    os.replace(temp_path, path)
+    _loaded_tex_glyphs[key] = parts
+
+
+def get_tex_glyphs(
+    tex_strings: Sequence[str], tex_environment="align*", tex_template=None
+) -> TexGlyphs:
+    key = get_tex_glyph_key(tex_strings, tex_environment, tex_template)
+    parts = load_tex_glyphs(key)
+    if parts is None:
+        tex = MathTex(*tex_strings, tex_environment=tex_environment, tex_template=tex_template)
+        parts = [
+            [glyph.points.copy() for glyph in part.family_members_with_points()] for part in tex
+        ]
+        save_tex_glyphs(key, parts)
+    return parts
+
+
+def _split_rows(glyphs: List[np.ndarray], num_rows: int) -> Optional[TexGlyphs]:
+    """Splits the glyphs of ``num_rows`` widely spaced rows at the ``num_rows - 1`` largest gaps
+    between their vertical centers. Returns ``None`` if one of those gaps is no wider than a glyph
+    or than twice a gap within a row, as happens when a row produced no glyphs."""
+    if len(glyphs) < num_rows:
+        return None
+    centers = np.array([(glyph[:, 1].min() + glyph[:, 1].max()) / 2 for glyph in glyphs])
+    order = np.argsort(-centers)
+    gaps = np.diff(-centers[order])
+    gap_order = np.argsort(gaps)
+    row_gaps, break_gaps = np.split(gaps[gap_order], [len(glyphs) - num_rows])
+    heights = [np.ptp(glyph[:, 1]) for glyph in glyphs]
+    if len(break_gaps) and break_gaps[0] <= max(heights + list(2 * row_gaps)):
+        return None
+    breaks = np.sort(gap_order[len(glyphs) - num_rows :]) + 1
+    rows = []
+    for row_order in np.split(order, breaks):
+        row = [glyphs[index] for index in np.sort(row_order)]
+        points = np.concatenate(row)
+        center = (points.min(axis=0) + points.max(axis=0)) / 2
+        rows.append([glyph - center for glyph in row])
+    return rows
+
+
+def precompile_tex(*tex_strings: str, tex_environment="align*", tex_template=None):
+    """Compiles every uncached TeX string in a single LaTeX run.
+
+    The strings are typeset as the rows of one document, widely spaced so the glyphs can be split
+    back into rows by their vertical position. Each row is then centered and cached exactly as
+    :class:`CachedMathTex` would cache the string on its own. If the rows cannot be told apart,
+    e.g. because a string has no glyphs, the strings are compiled one by one instead.
+    """
+    pending = [
+        tex_string
+        for tex_string in dict.fromkeys(tex_strings)
+        if load_tex_glyphs(get_tex_glyph_key([tex_string], tex_environment, tex_template)) is None
+    ]
+    if len(pending) < 2:
+        for tex_string in pending:
+            get_tex_glyphs([tex_string], tex_environment, tex_template)
+        return
+
+    tex = SingleStringMathTex(
+        r" \\[4em] ".join(pending), tex_environment=tex_environment, tex_template=tex_template
+    )
+    glyphs = [glyph.points.copy() for glyph in tex.family_members_with_points()]
+    rows = _split_rows(glyphs, len(pending))
+    if rows is None:
+        for tex_string in pending:
+            get_tex_glyphs([tex_string], tex_environment, tex_template)
+        return
+    for tex_string, row in zip(pending, rows):
+        save_tex_glyphs(get_tex_glyph_key([tex_string], tex_environment, tex_template), [row])
+
+
+class CachedMathTex(VGroup):
+    """A :class:`MathTex` look-alike whose glyph outlines are cached on disk.
+
+    The first construction of a given TeX string compiles it through :class:`MathTex` and stores
+    the glyph points under a hash of the string, environment, template, TeX compiler and manim
+    version. Every later construction, in this process or any other, only copies those points.
+
+    Parameters
+    ----------
+    tex_strings
+        The TeX strings, one submobject per string as in :class:`MathTex`.
+    tex_environment
+        The LaTeX environment the strings are compiled in.
+    tex_template
+        The template used for compilation; defaults to ``config.tex_template``.
+    font_size
+        The font size, applied as a scale on top of the cached geometry.
+    color
+        The fill color of the glyphs; not part of the cache key.
+    """
+
+    def __init__(
+        self,
+        *tex_strings: str,
+        tex_environment="align*",
+        tex_template=None,
+        font_size=DEFAULT_FONT_SIZE,
+        color=WHITE,
+        **kwargs,
+    ):
+        self.tex_strings = tex_strings
+        parts = get_tex_glyphs(tex_strings, tex_environment, tex_template)
+        super().__init__(
+            *[
+                VGroup(*[VMobject(fill_opacity=1.0, stroke_width=0).set_points(g) for g in part])
+                for part in parts
+            ],
+            **kwargs,
+        )
+        self.scale(font_size / DEFAULT_FONT_SIZE, about_point=ORIGIN)
+        self.set_color(color)
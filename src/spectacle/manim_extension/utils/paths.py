@@ -1,3 +1,4 @@
+from typing import Callable
 from manim import *
 
 
@@ -41,3 +42,94 @@ def get_wavy_curve_points(start=LEFT, end=RIGHT, width=0.5):
     top_control = mid + radius * perp
     btm_control = mid - radius * perp
     return [start, top_control, btm_control, end]
+
+
+def get_arc_center(start=LEFT, end=RIGHT, angle=PI / 2) -> np.ndarray:
+    chord = end - start
+    normal = _3d(-chord[1], chord[0])
+    return midpoint(start, end) + normal / (2 * np.tan(angle / 2))
+
+
+def get_arc_points(alphas: np.ndarray, start=LEFT, end=RIGHT, angle=0) -> np.ndarray:
+    alphas = np.asarray(alphas, dtype=float)
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    if angle == 0:
+        return start + np.outer(alphas, end - start)
+
+    center = get_arc_center(start, end, angle)
+    radial = start - center
+    thetas = alphas * angle
+    cos, sin = np.cos(thetas), np.sin(thetas)
+    points = np.empty((len(alphas), 3))
+    points[:, 0] = center[0] + cos * radial[0] - sin * radial[1]
+    points[:, 1] = center[1] + sin * radial[0] + cos * radial[1]
+    points[:, 2] = center[2] + radial[2]
+    return points
+
+
+def get_arc_normals(alphas: np.ndarray, start=LEFT, end=RIGHT, angle=0) -> np.ndarray:
+    alphas = np.asarray(alphas, dtype=float)
+    chord_angle = get_polar_angle(start, end)
+    thetas = chord_angle + PI / 2 + (alphas - 0.5) * angle
+    return np.stack([np.cos(thetas), np.sin(thetas), np.zeros_like(thetas)], axis=1)
+
+
+def scale_handles_to_anchors(points: np.ndarray, factor: float) -> np.ndarray:
+    curves = np.array(points, dtype=float).reshape(-1, 4, 3)
+    curves[:, 1] = curves[:, 0] + factor * (curves[:, 1] - curves[:, 0])
+    curves[:, 2] = curves[:, 3] + factor * (curves[:, 2] - curves[:, 3])
+    return curves.reshape(-1, 3)
+
+
+def apply_function_to_curves(
+    points: np.ndarray, function: Callable[[np.ndarray], np.ndarray], factor=0.01
+) -> np.ndarray:
+    """Applies a vectorized ``function`` to the Bézier ``points`` of a :class:`VMobject` the way
+    :meth:`VMobject.apply_function` does: the handles are pulled towards their anchors before
+    and pushed back out after, so that they follow the tangents of the mapped curve."""
+    return scale_handles_to_anchors(function(scale_handles_to_anchors(points, factor)), 1 / factor)
+
+
+def warp_points_along_arc(points: np.ndarray, start=LEFT, end=RIGHT, angle=0) -> np.ndarray:
+    alphas, offsets = points[:, 0], points[:, 1]
+    arc_points = get_arc_points(alphas, start, end, angle=angle)
+    return arc_points + offsets[:, np.newaxis] * get_arc_normals(alphas, start, end, angle=angle)
+
+
+def get_wavy_curves_points(start=LEFT, end=RIGHT, waves=4, width=0.5) -> np.ndarray:
+    start = np.asarray(start, dtype=float)
+    vec = np.asarray(end, dtype=float) - start
+    theta = np.angle(vec[0] + vec[1] * 1j)
+    offset = (width / 2) * np.array([-np.sin(theta), np.cos(theta), 0])
+
+    anchors = start + np.outer(np.arange(waves + 1) / waves, vec)
+    mids = (anchors[:-1] + anchors[1:]) / 2
+
+    points = np.empty((waves, 4, 3))
+    points[:, 0] = anchors[:-1]
+    points[:, 1] = mids + offset
+    points[:, 2] = mids - offset
+    points[:, 3] = anchors[1:]
+    return points.reshape(-1, 3)
+
+
+def get_gluon_curve_points(
+    start=LEFT, end=RIGHT, waves_per_unit=8, angle=0, samples_per_wave=12, stretch=15
+) -> np.ndarray:
+    length = diff_length(start, end)
+    loops = np.floor(waves_per_unit * length) - 0.5
+    wave_freq = 2 * loops * PI / length
+    num_samples = max(int(np.ceil(samples_per_wave * abs(loops))), 1) + 1
+    t = np.linspace(0, length, num_samples)
+
+    amp = 1 / ((1 / length) + stretch)
+    x = amp * (1 + stretch * t - np.cos(wave_freq * t)) / 1.03
+    y = amp * np.sin(wave_freq * t)
+
+    local_points = np.stack([x / length, y, np.zeros_like(t)], axis=1)
+    return warp_points_along_arc(local_points, start, end, angle=angle)
+
+
+def place_points_on_chord(points: np.ndarray, start=LEFT, end=RIGHT) -> np.ndarray:
+    return np.dot(points, np.asarray(rotation_about_z(get_polar_angle(start, end))).T) + start
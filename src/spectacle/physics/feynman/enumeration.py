@@ -0,0 +1,283 @@
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+import os
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+from .graph import *
+
+Edge = Tuple[int, int, str]
+# A wiring connects a row of open line ends ("stubs") with edges between stub owners and new
+# vertices. Stubs are numbered from 0, new vertices from -1 downwards.
+Wiring = Tuple[Edge, ...]
+WiringMemo = Dict[Tuple[Tuple[str, ...], int], List[Wiring]]
+
+INTERNAL = "internal"
+
+
+FERMIONS = (ELECTRON, QUARK)
+
+# The interaction vertices of QED and QCD. A fermion enters and leaves a vertex along the same
+# line, so every vertex holds at most one pair of fermion ends, both of one flavor.
+VERTICES = [
+    (ELECTRON, ELECTRON, PHOTON),
+    (QUARK, QUARK, PHOTON),
+    (QUARK, QUARK, GLUON),
+    (GLUON, GLUON, GLUON),
+]
+
+
+def get_vertex_rules(vertices: Optional[Sequence[Tuple[str, ...]]] = None) -> FrozenSet:
+    vertices = vertices if vertices is not None else VERTICES
+    for vertex in vertices:
+        fermions = [particle for particle in vertex if particle in FERMIONS]
+        if len(fermions) not in [0, 2] or len(set(fermions)) > 1:
+            raise Exception(f"Vertex {vertex} must join at most one fermion line of one flavor")
+    return frozenset(tuple(sorted(vertex)) for vertex in vertices)
+
+
+def get_fermion_flow(num_incoming: int, num_legs: int, edges: Sequence[Edge]) -> List[Edge]:
+    """Orients every fermion line of a diagram so its arrows run on through each vertex.
+
+    Lines are followed from the incoming legs in order, then from the outgoing legs in reverse
+    order, so of two legs joined by one line the first incoming (or outgoing) one is the particle
+    and the other the antiparticle. Closed loops are followed from their first edge.
+    """
+    edges = list(edges)
+    fermion_edges = [index for index, edge in enumerate(edges) if edge[2] in FERMIONS]
+    incident: Dict[int, List[int]] = {}
+    for index in fermion_edges:
+        for vertex in edges[index][:2]:
+            incident.setdefault(vertex, []).append(index)
+
+    starts = [*range(num_incoming), *reversed(range(num_incoming, num_legs))]
+    visited = set()
+    for vertex in starts + [edges[index][0] for index in fermion_edges]:
+        following = [index for index in incident.get(vertex, []) if index not in visited]
+        while len(following) > 0:
+            visited.add(following[0])
+            u, v, particle = edges[following[0]]
+            end = v if u == vertex else u
+            edges[following[0]] = (vertex, end, particle)
+            vertex = end
+            following = [index for index in incident[vertex] if index not in visited]
+    return edges
+
+
+def _refine_colors(colors: Sequence[str], edges: Sequence[Edge]) -> List[int]:
+    neighbors: List[List[Tuple[str, int]]] = [[] for _ in colors]
+    for u, v, particle in edges:
+        neighbors[u].append((particle, v))
+        neighbors[v].append((particle, u))
+
+    color_labels = {color: label for label, color in enumerate(sorted(set(colors)))}
+    labels = [color_labels[color] for color in colors]
+    num_labels = len(color_labels)
+    while True:
+        signatures = [
+            (labels[vertex], tuple(sorted((p, labels[n]) for p, n in neighbors[vertex])))
+            for vertex in range(len(colors))
+        ]
+        signature_labels = {sig: label for label, sig in enumerate(sorted(set(signatures)))}
+        labels = [signature_labels[signature] for signature in signatures]
+        if len(signature_labels) == num_labels:
+            return labels
+        num_labels = len(signature_labels)
+
+
+def get_canonical_form(colors: Sequence[str], edges: Sequence[Edge]) -> tuple:
+    """Returns a key shared by exactly the graphs isomorphic to this one.
+
+    Vertices are first split into classes by color refinement (1-dimensional Weisfeiler-Lehman),
+    then only permutations within each class are searched for the smallest sorted edge list.
+    Edges are undirected and labelled by species only, so a particle and its antiparticle are not
+    distinguished and a diagram shares its key with its charge conjugate.
+    """
+    labels = _refine_colors(colors, edges)
+    classes = [
+        [vertex for vertex in range(len(colors)) if labels[vertex] == label]
+        for label in sorted(set(labels))
+    ]
+    best = None
+    for permutations in itertools.product(*[itertools.permutations(c) for c in classes]):
+        position = {vertex: index for index, vertex in enumerate(itertools.chain(*permutations))}
+        key = tuple(
+            sorted(
+                (min(position[u], position[v]), max(position[u], position[v]), particle)
+                for u, v, particle in edges
+            )
+        )
+        if best is None or key < best:
+            best = key
+    ordered_colors = tuple(colors[vertex] for c in classes for vertex in c)
+    return ordered_colors, best
+
+
+def _get_branches(types: Sequence[str], budget: int, vertex_rules: FrozenSet) -> List[tuple]:
+    branches: List[tuple] = [("close", j) for j in range(1, len(types)) if types[j] == types[0]]
+    if budget > 0:
+        branches += [("vertex", rule) for rule in sorted(vertex_rules) if types[0] in rule]
+    return branches
+
+
+def _solve_branch(
+    types: Sequence[str],
+    budget: int,
+    branch: tuple,
+    vertex_rules: FrozenSet,
+    memo: WiringMemo,
+) -> List[Wiring]:
+    """Wires ``types`` after resolving the first stub as ``branch`` says: either closing it
+    against stub ``j``, or ending it on a new vertex that opens the other lines of ``rule``."""
+    kind, choice = branch
+    if kind == "close":
+        remaining = [i for i in range(1, len(types)) if i != choice]
+        head = (0, choice, types[0])
+        child_types = [types[i] for i in remaining]
+        child_budget = budget
+
+        def relabel(endpoint):
+            return remaining[endpoint] if endpoint >= 0 else endpoint
+
+    else:
+        others = list(choice)
+        others.remove(types[0])
+        head = (0, -1, types[0])
+        child_types = [*types[1:], *others]
+        child_budget = budget - 1
+
+        def relabel(endpoint):
+            if endpoint < 0:
+                return endpoint - 1
+            return endpoint + 1 if endpoint < len(types) - 1 else -1
+
+    wirings = []
+    for wiring in _get_wirings(child_types, child_budget, vertex_rules, memo):
+        edges = [(relabel(a), relabel(b), particle) for a, b, particle in wiring]
+        # Lines that would loop straight back into their own vertex can not be drawn.
+        if all(a != b for a, b, _ in edges):
+            wirings.append((head, *edges))
+    return wirings
+
+
+def _get_wirings(
+    types: Sequence[str], budget: int, vertex_rules: FrozenSet, memo: WiringMemo
+) -> List[Wiring]:
+    # Stubs of the same particle are interchangeable within a wiring, so every row of stubs is
+    # solved once in sorted order and the result is relabelled back to the caller's order.
+    order = sorted(range(len(types)), key=lambda index: types[index])
+    key = (tuple(types[index] for index in order), budget)
+    if key not in memo:
+        if len(types) == 0:
+            memo[key] = [()]
+        else:
+            memo[key] = [
+                wiring
+                for branch in _get_branches(key[0], budget, vertex_rules)
+                for wiring in _solve_branch(key[0], budget, branch, vertex_rules, memo)
+            ]
+    return [
+        tuple(
+            (order[a] if a >= 0 else a, order[b] if b >= 0 else b, particle)
+            for a, b, particle in wiring
+        )
+        for wiring in memo[key]
+    ]
+
+
+def _is_connected(num_vertices: int, edges: Sequence[Edge]) -> bool:
+    parents = list(range(num_vertices))
+
+    def find(vertex):
+        while parents[vertex] != vertex:
+            parents[vertex] = parents[parents[vertex]]
+            vertex = parents[vertex]
+        return vertex
+
+    for u, v, _ in edges:
+        parents[find(u)] = find(v)
+    return len({find(vertex) for vertex in range(num_vertices)}) == 1
+
+
+def _explore(
+    legs: Sequence[Tuple[str, str]], order: int, branch: tuple, vertex_rules: FrozenSet
+) -> dict:
+    colors = [f"{name}:{particle}" for name, particle in legs]
+    types = [particle for _, particle in legs]
+    diagrams = {}
+    for wiring in _solve_branch(types, order, branch, vertex_rules, {}):
+        num_internal = -min([0, *[endpoint for edge in wiring for endpoint in edge[:2]]])
+        diagram_colors = (*colors, *[INTERNAL] * num_internal)
+        edges = tuple(
+            (a if a >= 0 else len(legs) - a - 1, b if b >= 0 else len(legs) - b - 1, particle)
+            for a, b, particle in wiring
+        )
+        if _is_connected(len(diagram_colors), edges):
+            diagrams.setdefault(get_canonical_form(diagram_colors, edges), (diagram_colors, edges))
+    return diagrams
+
+
+def enumerate_diagrams(
+    incoming: Sequence[str],
+    outgoing: Sequence[str],
+    order: int,
+    vertex_rules: Optional[FrozenSet] = None,
+    processes: Optional[int] = None,
+) -> List[FeynmanGraph]:
+    """Generates every distinct connected diagram with the given external legs and at most
+    ``order`` interaction vertices of :func:`get_vertex_rules`.
+
+    Wirings of each row of open lines are memoized by their particle types and vertex budget, and
+    diagrams are deduplicated by :func:`get_canonical_form` with external legs kept
+    distinguishable. The branches of the first line are explored in a process pool of
+    ``processes`` workers; ``processes=1`` runs in this process.
+
+    Legs are given by species, e.g. ``ELECTRON`` for both the electron and the positron, and the
+    enumeration does not tell particles from antiparticles. Which legs carry antiparticles is
+    only decided afterwards, when :func:`get_fermion_flow` orients the fermion lines.
+    """
+    vertex_rules = vertex_rules if vertex_rules is not None else get_vertex_rules()
+    legs = [(f"in{n + 1}", particle) for n, particle in enumerate(incoming)] + [
+        (f"out{n + 1}", particle) for n, particle in enumerate(outgoing)
+    ]
+    if len(legs) == 0:
+        return []
+
+    branches = _get_branches([particle for _, particle in legs], order, vertex_rules)
+    workers = min(processes if processes is not None else (os.cpu_count() or 1), len(branches))
+
+    diagrams: dict = {}
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                _explore,
+                itertools.repeat(legs),
+                itertools.repeat(order),
+                branches,
+                itertools.repeat(vertex_rules),
+            )
+            for result in results:
+                for key, diagram in result.items():
+                    diagrams.setdefault(key, diagram)
+    else:
+        for branch in branches:
+            for key, diagram in _explore(legs, order, branch, vertex_rules).items():
+                diagrams.setdefault(key, diagram)
+
+    return [_make_graph(legs, len(incoming), *diagrams[key]) for key in sorted(diagrams, key=repr)]
+
+
+def _make_graph(
+    legs: Sequence[Tuple[str, str]],
+    num_incoming: int,
+    colors: Sequence[str],
+    edges: Sequence[Edge],
+) -> FeynmanGraph:
+    graph = FeynmanGraph()
+    for index, (name, _) in enumerate(legs):
+        graph.add_leg(name, incoming=index < num_incoming)
+    names = [name for name, _ in legs] + [f"v{n + 1}" for n in range(len(colors) - len(legs))]
+    for u, v, particle in get_fermion_flow(num_incoming, len(legs), edges):
+        # Boson lines point into the diagram from incoming legs and out of it to outgoing ones.
+        if particle not in FERMIONS and (num_incoming <= u < len(legs) or v < num_incoming):
+            u, v = v, u
+        graph.add_edge(names[u], names[v], particle)
+    return graph
@@ -0,0 +1,200 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from .layout import *
+from ...manim_extension.utils.paths import _3d
+
+
+def spring_layout(
+    edges: np.ndarray,
+    positions: np.ndarray,
+    fixed: Optional[np.ndarray] = None,
+    iterations=100,
+    spring_length=1.0,
+    temperature=0.5,
+    cooling=0.95,
+) -> np.ndarray:
+    """Relaxes ``positions`` with Fruchterman-Reingold forces, one array operation per step.
+
+    Parameters
+    ----------
+    edges
+        The ``(E, 2)`` vertex index pairs that attract each other.
+    positions
+        The ``(N, 2)`` or ``(N, 3)`` starting positions; only the first two coordinates move.
+    fixed
+        An ``(N,)`` boolean mask of vertices that keep their starting position.
+    iterations
+        The number of relaxation steps.
+    spring_length
+        The ideal distance between adjacent vertices.
+    temperature
+        The largest displacement allowed in the first step.
+    cooling
+        The factor the allowed displacement is multiplied by after each step.
+    """
+    positions = np.array(positions, dtype=float)
+    edges = np.asarray(edges, dtype=int).reshape(-1, 2)
+    free = np.ones(len(positions), dtype=bool) if fixed is None else ~np.asarray(fixed)
+    xy = positions[:, :2]
+
+    for _ in range(iterations):
+        # Repulsion sum_j w_ij (x_i - x_j), w_ij = k^2 / |x_i - x_j|^2, without (N, N, 2) arrays.
+        norms = np.einsum("ij,ij->i", xy, xy)
+        distance_sq = np.maximum(norms[:, np.newaxis] + norms[np.newaxis, :] - 2 * xy @ xy.T, 1e-9)
+        weights = spring_length**2 / distance_sq
+        np.fill_diagonal(weights, 0)
+        displacement = weights.sum(axis=1)[:, np.newaxis] * xy - weights @ xy
+
+        edge_delta = xy[edges[:, 0]] - xy[edges[:, 1]]
+        attraction = edge_delta * (np.linalg.norm(edge_delta, axis=1) / spring_length)[:, None]
+        for axis in range(2):
+            displacement[:, axis] += np.bincount(
+                edges[:, 1], attraction[:, axis], minlength=len(xy)
+            ) - np.bincount(edges[:, 0], attraction[:, axis], minlength=len(xy))
+
+        length = np.maximum(np.linalg.norm(displacement, axis=1), 1e-9)
+        displacement *= (np.minimum(length, temperature) / length)[:, np.newaxis]
+        xy[free] += displacement[free]
+        temperature *= cooling
+
+    return positions
+
+
+class FeynmanGraph:
+    """A declarative description of a Feynman diagram as vertices joined by typed edges.
+
+    External legs are vertices pinned to the left (incoming) or right (outgoing) side of the
+    diagram; every other vertex is placed by :func:`spring_layout`. Edges are typed by the
+    particle constants (:data:`ELECTRON`, :data:`PHOTON`, :data:`QUARK`, :data:`GLUON`) and point
+    from their first vertex to their second, which sets the fermion arrow direction.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        graph = (
+            FeynmanGraph()
+            .add_leg("in1").add_leg("in2")
+            .add_leg("out1", incoming=False).add_leg("out2", incoming=False)
+            .add_edge("in1", "a", ELECTRON).add_edge("a", "out1", ELECTRON)
+            .add_edge("in2", "b", ELECTRON).add_edge("b", "out2", ELECTRON)
+            .add_edge("a", "b", PHOTON)
+        )
+        diagram = FeynmanDiagram(graph)
+    """
+
+    def __init__(self):
+        self.vertices: List[str] = []
+        self.vertex_index: Dict[str, int] = {}
+        self.positions: Dict[str, np.ndarray] = {}
+        self.incoming: List[str] = []
+        self.outgoing: List[str] = []
+        self.edges: List[Tuple[int, int]] = []
+        self.edge_particles: List[str] = []
+
+    def add_vertex(self, name: str, position: Optional[Sequence[float]] = None):
+        if name not in self.vertex_index:
+            self.vertex_index[name] = len(self.vertices)
+            self.vertices.append(name)
+        if position is not None:
+            self.positions[name] = _3d(*position)
+        return self
+
+    def add_leg(self, name: str, incoming=True):
+        self.add_vertex(name)
+        (self.incoming if incoming else self.outgoing).append(name)
+        return self
+
+    def add_edge(self, start: str, end: str, particle: str):
+        if particle not in get_particle_renderers():
+            raise Exception(f"No particle renderer found for {particle}")
+        self.add_vertex(start).add_vertex(end)
+        self.edges.append((self.vertex_index[start], self.vertex_index[end]))
+        self.edge_particles.append(particle)
+        return self
+
+    def get_edge_array(self) -> np.ndarray:
+        return np.array(self.edges, dtype=int).reshape(-1, 2)
+
+    def get_external_positions(self, width=6.0, height=4.0) -> Dict[str, np.ndarray]:
+        positions = {}
+        for legs, x in [(self.incoming, -width / 2), (self.outgoing, width / 2)]:
+            for index, name in enumerate(legs):
+                y = 0 if len(legs) == 1 else height * (0.5 - index / (len(legs) - 1))
+                positions[name] = _3d(x, y)
+        return positions
+
+    def solve_layout(self, width=6.0, height=4.0, iterations=100, seed=0) -> np.ndarray:
+        positions = np.zeros((len(self.vertices), 3))
+        fixed = np.zeros(len(self.vertices), dtype=bool)
+        rng = np.random.default_rng(seed)
+        positions[:, :2] = rng.uniform(-0.25, 0.25, (len(self.vertices), 2)) * [width, height]
+
+        for name, position in {
+            **self.get_external_positions(width, height),
+            **self.positions,
+        }.items():
+            positions[self.vertex_index[name]] = position
+            fixed[self.vertex_index[name]] = True
+
+        spring_length = np.sqrt(width * height / max(len(self.vertices), 1))
+        return spring_layout(
+            self.get_edge_array(),
+            positions,
+            fixed=fixed,
+            iterations=iterations,
+            spring_length=spring_length,
+            temperature=max(width, height) / 4,
+        )
+
+    def get_edge_angles(self, max_angle=PI / 2) -> np.ndarray:
+        # Edges sharing a pair of vertices (loops, self-energies) are fanned out into arcs.
+        groups: Dict[Tuple[int, int], List[int]] = {}
+        for index, (start, end) in enumerate(self.edges):
+            groups.setdefault((min(start, end), max(start, end)), []).append(index)
+
+        angles = np.zeros(len(self.edges))
+        for (low, _), indices in groups.items():
+            if len(indices) == 1:
+                continue
+            spread = np.linspace(-max_angle, max_angle, len(indices))
+            for angle, index in zip(spread, indices):
+                angles[index] = angle if self.edges[index][0] == low else -angle
+        return angles
+
+
+class FeynmanDiagram(VGroup):
+    def __init__(
+        self,
+        graph: FeynmanGraph,
+        width=6.0,
+        height=4.0,
+        iterations=100,
+        seed=0,
+        hide_labels=False,
+    ):
+        self.graph = graph
+        self.positions = graph.solve_layout(width, height, iterations=iterations, seed=seed)
+
+        if not hide_labels:
+            precompile_particle_labels()
+
+        self.particle_objects = [
+            render_particle(
+                particle,
+                self.positions[start],
+                self.positions[end],
+                hide_labels=hide_labels,
+                angle=angle,
+            )
+            for (start, end), particle, angle in zip(
+                graph.edges, graph.edge_particles, graph.get_edge_angles()
+            )
+        ]
+        super().__init__(*self.particle_objects)
+
+    def get_vertex_position(self, name: str) -> np.ndarray:
+        return self.positions[self.graph.vertex_index[name]]
+
+    def interact_animations(self):
+        return schedule_animations(self.particle_objects, self.graph.get_edge_array())
@@ -1,13 +1,24 @@
+from typing import Optional
 from .particles import *
+from .schedule import *
+from ...manim_extension.mobject.tex_mobject import precompile_tex
 
 
 def get_particle_renderers():
     return {ELECTRON: Electron, PHOTON: Photon, QUARK: Quark, GLUON: Gluon}
 
 
-def render_particle(particle, start, end, hide_labels=False):
+def render_particle(particle, start, end, hide_labels=False, **kwargs):
     Renderer = get_particle_renderers()[particle]
-    return Renderer(start=start, end=end, show_label=(not hide_labels))
+    return Renderer(start=start, end=end, show_label=(not hide_labels), **kwargs)
+
+
+def get_particle_codes():
+    return {particle: code for code, particle in enumerate(get_particle_renderers())}
+
+
+def precompile_particle_labels():
+    precompile_tex(*get_particle_renderers().keys())
 
 
 def get_particle_interactions():
@@ -47,6 +58,9 @@ class TwoVertexLayout(VGroup):
         virtual_particle=PHOTON,
         hide_labels=False,
     ):
+        if not hide_labels:
+            precompile_particle_labels()
+
         left_chain_points = chain_points(LEFT)
         if is_left_anti:
             left_chain_points.reverse()
@@ -101,11 +115,9 @@ class TwoVertexLayout(VGroup):
         super().__init__(*vmobjects)
 
     def interact_animations(self):
-        return [
-            AnimationGroup(*[n.get_interact_animation() for n in self.incoming_particles]),
-            Create(self.virtual_particle),
-            AnimationGroup(*[n.get_interact_animation() for n in self.outgoing_particles]),
-        ]
+        return schedule_animations(
+            [*self.incoming_particles, self.virtual_particle, *self.outgoing_particles]
+        )
 
 
 dl = "down-left"
@@ -129,42 +141,73 @@ class FourVertexBoxLayout:
         self.x_diff = {dl: LEFT, dr: RIGHT, ul: LEFT, ur: RIGHT}
         self.y_diff = {dl: DOWN, dr: DOWN, ul: UP, ur: UP}
 
-        self.points = {
-            dl: {inner: LEFT + mid_height * DOWN / 2},
-            dr: {inner: RIGHT + mid_height * DOWN / 2},
-            ul: {inner: LEFT + mid_height * UP / 2},
-            ur: {inner: RIGHT + mid_height * UP / 2},
+        # Vertex ``(dir, layer)`` is row ``vertex_index[(dir, layer)]`` of ``vertex_points``.
+        self.vertex_index = {
+            key: index
+            for index, key in enumerate((d, layer) for d in self.dirs for layer in self.layers)
         }
+        self.vertex_points = np.zeros((len(self.vertex_index), 3))
 
         inner_outer_spacing = [1, 1]
 
         for n in self.dirs:
-            self.points[n][outer] = (
-                self.points[n][inner]
+            inner_point = self.x_diff[n] + mid_height * self.y_diff[n] / 2
+            self.vertex_points[self.get_vertex(n, inner)] = inner_point
+            self.vertex_points[self.get_vertex(n, outer)] = (
+                inner_point
                 + self.x_diff[n] * inner_outer_spacing[0]
                 + self.y_diff[n] * inner_outer_spacing[1]
             )
 
-        def new_layers(new_value):
-            return {inner: new_value(), outer: new_value()}
+        # Each edge row is ``(start vertex, end vertex, particle code)``; ``edge_particles``
+        # holds the rendered particle of the same row.
+        self.edges = np.zeros((len(self.vertex_index), 3), dtype=int)
+        self.num_edges = 0
+        self.edge_particles = []
+
+    def get_vertex(self, direction, layer) -> int:
+        return self.vertex_index[(direction, layer)]
+
+    def get_point(self, direction, layer) -> np.ndarray:
+        return self.vertex_points[self.get_vertex(direction, layer)]
 
-        def new_dirs(new_value):
-            return {
-                dl: new_value(),
-                dr: new_value(),
-                ul: new_value(),
-                ur: new_value(),
-            }
+    def get_edges(self) -> np.ndarray:
+        return self.edges[: self.num_edges]
 
-        self.particles = new_dirs(
-            lambda: new_layers(lambda: new_dirs(lambda: new_layers(lambda: None)))
+    def get_edge_points(self) -> np.ndarray:
+        return self.vertex_points[self.get_edges()[:, :2]]
+
+    def add_edge(self, dir1, layer1, dir2, layer2, particle, particle_object=None) -> int:
+        if self.num_edges == len(self.edges):
+            self.edges = np.concatenate([self.edges, np.zeros_like(self.edges)])
+        self.edges[self.num_edges] = (
+            self.get_vertex(dir1, layer1),
+            self.get_vertex(dir2, layer2),
+            get_particle_codes()[particle],
+        )
+        self.edge_particles.append(particle_object)
+        self.num_edges += 1
+        return self.num_edges - 1
+
+    def find_edge(self, dir1, layer1, dir2, layer2) -> Optional[int]:
+        edges = self.get_edges()
+        matches = np.flatnonzero(
+            (edges[:, 0] == self.get_vertex(dir1, layer1))
+            & (edges[:, 1] == self.get_vertex(dir2, layer2))
         )
+        return matches[-1] if len(matches) > 0 else None
+
+    def get_particle(self, dir1, layer1, dir2, layer2):
+        index = self.find_edge(dir1, layer1, dir2, layer2)
+        return self.edge_particles[index] if index is not None else None
 
 
 class ParticleInteractionManager(FourVertexBoxLayout):
     def __init_particles__(self, hide_labels=False):
         self.__init_layout__()
         self.hide_labels = hide_labels
+        if not hide_labels:
+            precompile_particle_labels()
         self.particle_interaction_map = get_particle_interactions()
         self.particle_objects = []
 
@@ -175,11 +218,15 @@ class ParticleInteractionManager(FourVertexBoxLayout):
         return render_particle(particle, start, end, hide_labels=self.hide_labels)
 
     def create_particle(self, dir1, layer1, dir2, layer2, particle):
-        self.particles[dir1][layer1][dir2][layer2] = self.render_particle(
-            particle, self.points[dir1][layer1], self.points[dir2][layer2]
+        particle_object = self.render_particle(
+            particle, self.get_point(dir1, layer1), self.get_point(dir2, layer2)
         )
-        self.particle_objects.append(self.particles[dir1][layer1][dir2][layer2])
-        return self.particles[dir1][layer1][dir2][layer2]
+        self.add_edge(dir1, layer1, dir2, layer2, particle, particle_object)
+        self.particle_objects.append(particle_object)
+        return particle_object
+
+    def interact_animations(self):
+        return schedule_animations(self.edge_particles, self.get_edges()[:, :2])
 
 
 class FourVertexLayoutDoubleInterchange(VGroup, ParticleInteractionManager):
@@ -222,15 +269,6 @@ class FourVertexLayoutDoubleInterchange(VGroup, ParticleInteractionManager):
 
         super().__init__(*self.particle_objects)
 
-    def interact_animations(self):
-        return [
-            AnimationGroup(*[n.get_interact_animation() for n in self.movement1]),
-            Create(self.exchange1),
-            AnimationGroup(*[n.get_interact_animation() for n in self.movement2]),
-            Create(self.exchange2),
-            AnimationGroup(*[n.get_interact_animation() for n in self.movement3]),
-        ]
-
 
 class FourVertexLayoutCrossoverInterchange(VGroup, ParticleInteractionManager):
     def __init__(
@@ -271,13 +309,6 @@ class FourVertexLayoutCrossoverInterchange(VGroup, ParticleInteractionManager):
 
         super().__init__(*self.particle_objects)
 
-    def interact_animations(self):
-        return [
-            AnimationGroup(*[n.get_interact_animation() for n in self.movement1]),
-            AnimationGroup(*[n.get_interact_animation() for n in self.movement2]),
-            AnimationGroup(*[n.get_interact_animation() for n in self.movement3]),
-        ]
-
 
 class ProtonConfinement(VGroup):
     def __init__(
@@ -490,15 +521,4 @@ class ProtonConfinement(VGroup):
         return particle
 
     def interact_animations(self):
-        return [
-            AnimationGroup(*[n.get_interact_animation() for n in self.movement1]),
-            Create(self.exchange1),
-            AnimationGroup(*[n.get_interact_animation() for n in self.movement2]),
-            Create(self.exchange2),
-            AnimationGroup(*[n.get_interact_animation() for n in self.movement3]),
-            AnimationGroup(*[n.get_interact_animation() for n in self.movement4]),
-            Create(self.exchange3),
-            AnimationGroup(*[n.get_interact_animation() for n in self.movement5]),
-            Create(self.exchange4),
-            AnimationGroup(*[n.get_interact_animation() for n in self.movement6]),
-        ]
+        return schedule_animations(self.particle_objects)
@@ -1,7 +1,17 @@
-from typing import Iterable
+from functools import lru_cache
+from typing import Iterable, Tuple
 from manim import *
+from ...manim_extension.animation.creation import BatchedCreate
 from ...manim_extension.mobject.geometry import WavyLine
-from ...manim_extension.utils.paths import _3d
+from ...manim_extension.mobject.tex_mobject import CachedMathTex
+from ...manim_extension.utils.paths import (
+    apply_function_to_curves,
+    diff_length,
+    get_arc_points,
+    get_gluon_curve_points,
+    place_points_on_chord,
+    warp_points_along_arc,
+)
 
 # __all__ = [
 #     "ELECTRON",
@@ -17,6 +27,68 @@ PHOTON = "\gamma"
 GLUON = "g"
 QUARK = "q"
 
+PARTICLE_TEMPLATE_CACHE_SIZE = 256
+
+
+def _template_length(start, end) -> float:
+    return round(float(diff_length(start, end)), 9)
+
+
+def _freeze(points: np.ndarray) -> np.ndarray:
+    points.setflags(write=False)
+    return points
+
+
+# Particle geometry only depends on the start and end points through the chord length and
+# direction, so each template is built once along ``ORIGIN -> length * RIGHT`` and then placed
+# with :func:`place_points_on_chord`.
+@lru_cache(maxsize=PARTICLE_TEMPLATE_CACHE_SIZE)
+def get_fermion_template(length: float, angle=0, tip_alpha=0.5) -> Tuple[np.ndarray, np.ndarray]:
+    line = Line(start=ORIGIN, end=RIGHT)
+    line.set_points(
+        apply_function_to_curves(
+            line.points, lambda p: get_arc_points(p[:, 0], ORIGIN, length * RIGHT, angle=angle)
+        )
+    )
+
+    tip_scale = tip_alpha
+    if tip_alpha > 0.5:
+        tip_scale = 1 - tip_alpha
+
+    midarrow_tip = (
+        Triangle()
+        .move_to(line.point_from_proportion(tip_alpha))
+        .scale(0.035 * line.get_length() * (tip_scale * 2))
+        .rotate(angle_of_vector(line.get_vector()) - PI / 2)
+    )
+    return _freeze(line.points.copy()), _freeze(midarrow_tip.points.copy())
+
+
+@lru_cache(maxsize=PARTICLE_TEMPLATE_CACHE_SIZE)
+def get_photon_template(length: float, angle=0, waves=4, width=0.5) -> np.ndarray:
+    curve = WavyLine(start=ORIGIN, end=RIGHT, waves=waves * int(np.ceil(length)), width=width)
+    return _freeze(
+        apply_function_to_curves(
+            curve.points, lambda p: warp_points_along_arc(p, ORIGIN, length * RIGHT, angle=angle)
+        )
+    )
+
+
+@lru_cache(maxsize=PARTICLE_TEMPLATE_CACHE_SIZE)
+def get_gluon_template(
+    length: float, angle=0, waves_per_unit=8, samples_per_wave=12
+) -> np.ndarray:
+    curve = VMobject().set_points_smoothly(
+        get_gluon_curve_points(
+            ORIGIN,
+            length * RIGHT,
+            waves_per_unit=waves_per_unit,
+            angle=angle,
+            samples_per_wave=samples_per_wave,
+        )
+    )
+    return _freeze(curve.points.copy())
+
 
 class Particle(VGroup):
     def __init__(self, *particle_objects: list, label="", label_color, **kwargs):
@@ -28,7 +100,7 @@ class Particle(VGroup):
         super().__init__(*self.particle_objects, **kwargs)
 
     def get_interact_animation(self):
-        return AnimationGroup(*[Create(n) for n in self.particle_objects])
+        return BatchedCreate(*self.particle_objects)
 
 
 class Fermion(Particle):
@@ -43,32 +115,15 @@ class Fermion(Particle):
         tip_alpha=0.5,
         **kwargs,
     ):
+        line_points, tip_points = get_fermion_template(
+            _template_length(start, end), angle=angle, tip_alpha=tip_alpha
+        )
+
         self.line = Line(start=ORIGIN, end=RIGHT, color=color, **kwargs)
+        self.line.set_points(place_points_on_chord(line_points, start, end))
 
-        # print({"start": start, "end": end, "angle": angle})
-        self.arc = ArcBetweenPoints(start, end, angle=angle)
-        self.line.apply_function(lambda p: self.arc.point_from_proportion(p[0]))
-
-        # linear_angle = self.line.get_angle()
-        # perp = _3d(-np.sin(linear_angle), np.cos(linear_angle))
-        # normal = self.rad * perp / np.linalg.norm(perp)
-
-        # def transform_arc(p):
-        #     x, y = p[0], p[1]
-        #     new_p = self.arc.point_from_proportion(x)
-        #     vec_to_center = new_p - self.arc.get_center()
-        #     return new_p + y * ((1 - 2 * angle / PI) * normal + (2 * angle / PI) * vec_to_center)
-
-        tip_scale = tip_alpha
-        if tip_alpha > 0.5:
-            tip_scale = 1 - tip_alpha
-
-        self.midarrow_tip = (
-            Triangle(color=color, fill_opacity=1)
-            .move_to(self.line.point_from_proportion(tip_alpha))
-            .scale(0.035 * self.line.get_length() * (tip_scale * 2))
-            .rotate(angle_of_vector(self.line.get_vector()) - PI / 2)
-        )
+        self.midarrow_tip = Triangle(color=color, fill_opacity=1)
+        self.midarrow_tip.set_points(place_points_on_chord(tip_points, start, end))
 
         super().__init__(
             *[self.line, self.midarrow_tip], label=label, label_color=label_color, **kwargs
@@ -191,28 +246,10 @@ class Photon(Particle):
         **kwargs,
     ):
         self.line = Line(start=start, end=end)
-        self.curve = WavyLine(
-            start=ORIGIN,
-            end=RIGHT,
-            waves=waves * int(np.ceil(np.linalg.norm(end - start))),
-            width=width,
-            color=color,
+        template = get_photon_template(
+            _template_length(start, end), angle=angle, waves=waves, width=width
         )
-
-        self.arc = ArcBetweenPoints(start, end, angle=angle)
-
-        def transform_arc(p):
-            x, y = p[0], p[1]
-            new_p = self.arc.point_from_proportion(x)
-            vec_to_center = new_p - self.arc.get_center()
-
-            linear_angle = self.line.get_angle()
-            perp = _3d(-np.sin(linear_angle), np.cos(linear_angle))
-            normal = perp / np.linalg.norm(perp)
-
-            return new_p + y * ((1 - 2 * angle / PI) * normal + (2 * angle / PI) * vec_to_center)
-
-        self.curve.apply_function(transform_arc)
+        self.curve = VMobject(color=color).set_points(place_points_on_chord(template, start, end))
 
         label = {True: PHOTON}.get(show_label, "")
 
@@ -230,50 +267,28 @@ class Gluon(Particle):
         show_label=False,
         label_color=WHITE,
         waves_per_unit=8,
+        samples_per_wave=12,
         **kwargs,
     ):
         self.line = Line(start=start, end=end)
         self.waves_per_unit = waves_per_unit
 
-        self.curve = ParametricFunction(
-            self.gluon_parametric_func, t_range=np.array([0, self.line.get_length()])
-        ).set_color_by_gradient([color, anti_color, color, anti_color, color])
-
-        # self.arc = ArcBetweenPoints(start, end, angle=angle)
-
-        # def transform_arc(p):
-        #     x, y = p[0], p[1]
-        #     if x > 1:
-        #         x = 1
-        #     new_p = self.arc.point_from_proportion(x)
-        #     vec_to_center = new_p - self.arc.get_center()
-
-        #     linear_angle = self.line.get_angle()
-        #     perp = _3d(-np.sin(linear_angle), np.cos(linear_angle))
-        #     normal = perp / np.linalg.norm(perp)
-
-        #     return new_p + y * ((1 - 2 * angle / PI) * normal + (2 * angle / PI) * vec_to_center)
-
-        # self.curve.apply_function(transform_arc)
+        template = get_gluon_template(
+            _template_length(start, end),
+            angle=angle,
+            waves_per_unit=waves_per_unit,
+            samples_per_wave=samples_per_wave,
+        )
+        self.curve = (
+            VMobject()
+            .set_points(place_points_on_chord(template, start, end))
+            .set_color_by_gradient([color, anti_color, color, anti_color, color])
+        )
 
         label = {True: GLUON}.get(show_label, "")
 
         super().__init__(*[self.curve], label=label, label_color=label_color, **kwargs)
 
-    def gluon_parametric_func(self, t):
-        length = self.line.get_length()
-        theta = self.line.get_angle()
-
-        wave_freq = (2 * np.floor(self.waves_per_unit * length) - 1) * PI / length
-        stretch = 15
-
-        x = (1 + stretch * t - np.cos(wave_freq * t)) / 1.03
-        y = np.sin(wave_freq * t)
-
-        amp = 1 / ((1 / length) + stretch)
-        base_path = amp * np.matmul(rotation_about_z(theta), np.array([x, y, 0]))
-        return base_path + self.line.get_start()
-
 
 class Boson(VGroup):
     def __init__(
@@ -300,13 +315,13 @@ class Chain(VGroup):
         super().__init__(*self.particle_objects)
 
     def interact_animation(self):
-        return AnimationGroup(*[n.get_interact_animation() for n in self.particle_objects])
+        return BatchedCreate(*self.particle_objects)
 
     def get_interact_animation(self):
-        return AnimationGroup(*[n.get_interact_animation() for n in self.particle_objects])
+        return BatchedCreate(*self.particle_objects)
 
 
-class MidpointNormalLabel(MathTex):
+class MidpointNormalLabel(CachedMathTex):
     def __init__(self, *text_strings, line: VMobject, **kwargs):
         super().__init__(*text_strings, **kwargs)
         angle = line.get_angle()
@@ -0,0 +1,152 @@
+from typing import Callable, List, Optional, Sequence
+from .particles import *
+
+
+def get_edge_levels(
+    edges: np.ndarray, num_vertices: Optional[int] = None, exchanges: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Returns the stage of every ``(start, end)`` edge: the number of edges on the longest chain
+    leading into its start vertex, so an edge is drawn once everything before its vertex is.
+
+    Edges marked in ``exchanges`` have no direction: an exchange is drawn once both of its
+    vertices are reached, at the later of their stages, and both vertices move on after it. When
+    every remaining exchange waits on the other end of another one, as in a crossed box, the
+    stuck exchanges are drawn from the vertex already reached instead. A closed loop of directed
+    edges has no first vertex, so the loop vertex waiting on the fewest edges is started early.
+    """
+    edges = np.asarray(edges, dtype=int).reshape(-1, 2)
+    if num_vertices is None:
+        num_vertices = int(edges.max(initial=-1)) + 1
+    exchanges = np.zeros(len(edges), dtype=bool) if exchanges is None else np.asarray(exchanges)
+
+    outgoing: List[List[int]] = [[] for _ in range(num_vertices)]
+    waiting: List[List[int]] = [[] for _ in range(num_vertices)]
+    unresolved = np.zeros(num_vertices, dtype=int)
+    for index, (start, end) in enumerate(edges):
+        if exchanges[index]:
+            waiting[start].append(index)
+            waiting[end].append(index)
+        else:
+            outgoing[start].append(index)
+            unresolved[end] += 1
+
+    depths = np.zeros(num_vertices, dtype=int)
+    levels = np.zeros(len(edges), dtype=int)
+    pending = set(range(num_vertices))
+    reached = set()
+    drawn = np.zeros(len(edges), dtype=bool)
+
+    def draw(index, level, *vertices):
+        levels[index] = level
+        drawn[index] = True
+        for vertex in vertices:
+            depths[vertex] = max(depths[vertex], level + 1)
+
+    while len(pending) > 0:
+        reached.update(vertex for vertex in pending if unresolved[vertex] == 0)
+        ready = [vertex for vertex in pending & reached if all(drawn[waiting[vertex]])]
+        exchanges_ready = {
+            index
+            for vertex in reached
+            for index in waiting[vertex]
+            if not drawn[index] and set(edges[index]) <= reached
+        }
+        for index in sorted(exchanges_ready):
+            draw(index, depths[edges[index]].max(), *edges[index])
+
+        if len(ready) == 0 and len(exchanges_ready) == 0:
+            stuck = {index for vertex in reached for index in waiting[vertex] if not drawn[index]}
+            if len(stuck) == 0:
+                vertex = min(pending - reached, key=lambda vertex: (unresolved[vertex], vertex))
+                reached.add(vertex)
+                continue
+            for index in stuck:
+                start, end = edges[index] if edges[index, 0] in reached else edges[index, ::-1]
+                waiting[start].remove(index)
+                waiting[end].remove(index)
+                outgoing[start].append(index)
+                unresolved[end] += 1
+            continue
+
+        for vertex in ready:
+            pending.remove(vertex)
+            for index in outgoing[vertex]:
+                end = edges[index, 1]
+                draw(index, depths[vertex], end)
+                unresolved[end] -= 1
+
+    return levels
+
+
+def get_edge_stages(edges: np.ndarray, exchanges: Optional[np.ndarray] = None) -> List[np.ndarray]:
+    levels = get_edge_levels(edges, exchanges=exchanges)
+    return [np.flatnonzero(levels == level) for level in np.unique(levels)]
+
+
+def get_vertex_edges(endpoints: np.ndarray, decimals=6) -> np.ndarray:
+    # Endpoints that coincide after rounding are the same vertex; adding 0.0 turns -0.0 into 0.0.
+    points = np.round(np.asarray(endpoints, dtype=float).reshape(-1, 3), decimals) + 0.0
+    _, vertices = np.unique(points, axis=0, return_inverse=True)
+    return vertices.reshape(-1, 2)
+
+
+def get_particle_endpoints(particle: Mobject) -> np.ndarray:
+    if isinstance(particle, Chain):
+        return np.array(
+            [
+                get_particle_endpoints(particle.particle_objects[0])[0],
+                get_particle_endpoints(particle.particle_objects[-1])[1],
+            ]
+        )
+    return np.array([particle.line.get_start(), particle.line.get_end()])
+
+
+def get_exchange_edges(particle_objects: Sequence[Mobject], edges: np.ndarray) -> np.ndarray:
+    """Marks the boson lines that join two interaction vertices. These exchanges are drawn in no
+    particular direction, so they carry no causal order of their own."""
+    edges = np.asarray(edges, dtype=int).reshape(-1, 2)
+    degrees = np.bincount(edges.ravel(), minlength=int(edges.max(initial=-1)) + 1)
+    bosons = np.array(
+        [
+            not isinstance(
+                particle.particle_objects[0] if isinstance(particle, Chain) else particle, Fermion
+            )
+            for particle in particle_objects
+        ],
+        dtype=bool,
+    ).reshape(-1)
+    return bosons & (degrees[edges[:, 0]] > 1) & (degrees[edges[:, 1]] > 1)
+
+
+def schedule_animations(
+    particle_objects: Sequence[Mobject],
+    edges: Optional[np.ndarray] = None,
+    animation: Callable[..., Animation] = BatchedCreate,
+    exchanges: Optional[np.ndarray] = None,
+) -> List[Animation]:
+    """Returns one ``animation`` per stage of :func:`get_edge_levels`, so the diagram plays with
+    as few sequential ``play`` calls as its causal order allows.
+
+    Parameters
+    ----------
+    particle_objects
+        The particles of the diagram, one per edge.
+    edges
+        The ``(E, 2)`` start and end vertex of each particle. By default the vertices are found
+        from the particles' endpoints with :func:`get_vertex_edges`.
+    animation
+        Builds the animation of one stage from its particles.
+    exchanges
+        Marks the edges drawn in no particular direction; by default the boson lines found by
+        :func:`get_exchange_edges`.
+    """
+    if edges is None:
+        edges = get_vertex_edges(
+            [get_particle_endpoints(particle) for particle in particle_objects]
+        )
+    if exchanges is None:
+        exchanges = get_exchange_edges(particle_objects, edges)
+    return [
+        animation(*[particle_objects[index] for index in stage])
+        for stage in get_edge_stages(edges, exchanges)
+    ]
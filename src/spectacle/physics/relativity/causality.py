@@ -0,0 +1,167 @@
+from manim import *
+
+# Imported after manim, whose star import includes its boolean-operation mobject ``Union``.
+from typing import Dict, List, Optional, Sequence, Union
+
+SPACELIKE = -1
+LIGHTLIKE = 0
+TIMELIKE = 1
+
+
+def get_intervals(coords1: np.ndarray, coords2: np.ndarray) -> np.ndarray:
+    """Returns the squared intervals ``(c dt)^2 - dx^2`` between matching rows of two ``(N, 2)``
+    arrays of ``(x, ct)`` coordinates; broadcasting gives pairwise matrices."""
+    delta = np.asarray(coords2, dtype=float) - np.asarray(coords1, dtype=float)
+    return delta[..., 1] ** 2 - delta[..., 0] ** 2
+
+
+def classify_intervals(intervals: np.ndarray, tolerance=1e-9) -> np.ndarray:
+    codes = np.where(intervals > 0, TIMELIKE, SPACELIKE)
+    codes[np.abs(intervals) <= tolerance] = LIGHTLIKE
+    return codes
+
+
+class EventStore:
+    """Spacetime events kept as one ``(N, 2)`` array of rest-frame ``(x, ct)`` coordinates.
+
+    Events are indexed by time: a sorted view of ``ct`` is kept, so light-cone and region queries
+    only look at the time slice that can answer them, and per-event queries never build more than
+    one row of intervals. Interval and causal matrices are computed with one broadcast for the
+    rows that are asked for; the full ``N x N`` matrices take ``8 N^2`` bytes, so they are only
+    built, and cached until the next event is added, up to ``max_matrix_events``. Intervals and
+    causal order are invariant under boosts, so queries hold in every frame.
+
+    Parameters
+    ----------
+    tolerance
+        The largest absolute squared interval still classified as :data:`LIGHTLIKE`.
+    max_matrix_events
+        The largest store for which the full matrices may be built; larger stores must ask for
+        rows of them.
+    """
+
+    def __init__(self, tolerance=1e-9, max_matrix_events=4096):
+        self.tolerance = tolerance
+        self.max_matrix_events = max_matrix_events
+        self.names: List[str] = []
+        self.name_index: Dict[str, int] = {}
+        self.coords = np.zeros((16, 2))
+        self.num_events = 0
+        self.__time_order__: Optional[np.ndarray] = None
+        self.__sorted_times__ = np.zeros(0)
+        self.__interval_matrix__: Optional[np.ndarray] = None
+
+    def __len__(self):
+        return self.num_events
+
+    def add_events(self, names: Sequence[str], coords: np.ndarray):
+        """Adds events by name with their rest-frame ``(x, ct)`` coordinates."""
+        coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        if len(names) != len(coords):
+            raise Exception(f"Got {len(names)} event names for {len(coords)} coordinates")
+
+        # Adding an existing name moves that event, as re-adding a Dot to Spacetime.events does.
+        for name in names:
+            if name not in self.name_index:
+                self.name_index[name] = len(self.names)
+                self.names.append(name)
+        while len(self.names) > len(self.coords):
+            self.coords = np.concatenate([self.coords, np.zeros_like(self.coords)])
+        self.coords[self.get_indices(names)] = coords
+        self.num_events = len(self.names)
+        self.__time_order__ = None
+        self.__interval_matrix__ = None
+        return self
+
+    def add_event(self, name: str, x: float, t: float):
+        return self.add_events([name], [[x, t]])
+
+    def get_indices(self, events: Sequence[Union[int, str]]) -> np.ndarray:
+        return np.array(
+            [self.name_index[event] if isinstance(event, str) else event for event in events],
+            dtype=int,
+        )
+
+    def get_coords(self, events: Optional[Sequence[Union[int, str]]] = None) -> np.ndarray:
+        if events is None:
+            return self.coords[: self.num_events]
+        return self.coords[self.get_indices(events)]
+
+    def get_time_order(self) -> np.ndarray:
+        if self.__time_order__ is None:
+            self.__time_order__ = np.argsort(self.get_coords()[:, 1], kind="stable")
+            self.__sorted_times__ = self.get_coords()[self.__time_order__, 1]
+        return self.__time_order__
+
+    def get_interval_matrix(
+        self, events: Optional[Sequence[Union[int, str]]] = None
+    ) -> np.ndarray:
+        """Returns the ``(len(events), N)`` squared intervals from ``events`` to every event. The
+        full matrix, for ``events=None``, is only built up to ``max_matrix_events`` events."""
+        if events is not None:
+            return get_intervals(self.get_coords(events)[:, np.newaxis], self.get_coords())
+        if self.num_events > self.max_matrix_events:
+            raise Exception(
+                f"The full interval matrix of {self.num_events} events is too large; pass the "
+                f"events to compute its rows, or raise max_matrix_events"
+            )
+        if self.__interval_matrix__ is None:
+            self.__interval_matrix__ = self.get_interval_matrix(range(self.num_events))
+        return self.__interval_matrix__
+
+    def get_interval_types(self, events: Optional[Sequence[Union[int, str]]] = None) -> np.ndarray:
+        return classify_intervals(self.get_interval_matrix(events), self.tolerance)
+
+    def classify(
+        self, events1: Sequence[Union[int, str]], events2: Sequence[Union[int, str]]
+    ) -> np.ndarray:
+        """Classifies the intervals between matching pairs of events."""
+        intervals = get_intervals(self.get_coords(events1), self.get_coords(events2))
+        return classify_intervals(intervals, self.tolerance)
+
+    def get_causal_matrix(self, events: Optional[Sequence[Union[int, str]]] = None) -> np.ndarray:
+        """Returns the ``(len(events), N)`` matrix whose entry ``[i, j]`` says the ``i``-th of
+        ``events`` can influence event ``j``: ``j`` lies in its future light cone, on or inside it.
+        """
+        times = self.get_coords()[:, 1]
+        row_times = times if events is None else self.get_coords(events)[:, 1]
+        return (self.get_interval_matrix(events) >= -self.tolerance) & (
+            times[np.newaxis] > row_times[:, np.newaxis]
+        )
+
+    def precedes(self, event1: Union[int, str], event2: Union[int, str]) -> bool:
+        coords1, coords2 = self.get_coords([event1, event2])
+        return bool(coords2[1] > coords1[1] and get_intervals(coords1, coords2) >= -self.tolerance)
+
+    def get_causal_order(self) -> List[str]:
+        """Returns the event names in an order that respects every causal relation. Any order
+        by time does, since an event can only influence later ones."""
+        return [self.names[index] for index in self.get_time_order()]
+
+    def get_time_slice(self, t_min=-np.inf, t_max=np.inf) -> np.ndarray:
+        order = self.get_time_order()
+        times = self.__sorted_times__
+        return order[
+            np.searchsorted(times, t_min, "left") : np.searchsorted(times, t_max, "right")
+        ]
+
+    def get_region(self, x_range: Sequence[float], t_range: Sequence[float]) -> np.ndarray:
+        candidates = self.get_time_slice(*t_range)
+        x = self.get_coords()[candidates, 0]
+        return candidates[(x >= x_range[0]) & (x <= x_range[1])]
+
+    def get_light_cone(self, event: Union[int, str], future=True) -> np.ndarray:
+        """Returns the indices of the events on or inside the future (or past) light cone of
+        ``event``, searching only the events later (or earlier) than it."""
+        index = self.get_indices([event])[0]
+        t = self.coords[index, 1]
+        candidates = self.get_time_slice(t_min=t) if future else self.get_time_slice(t_max=t)
+        candidates = candidates[candidates != index]
+        intervals = get_intervals(self.coords[index], self.get_coords()[candidates])
+        return candidates[intervals >= -self.tolerance]
+
+    def get_future(self, event: Union[int, str]) -> List[str]:
+        return [self.names[index] for index in self.get_light_cone(event, future=True)]
+
+    def get_past(self, event: Union[int, str]) -> List[str]:
+        return [self.names[index] for index in self.get_light_cone(event, future=False)]
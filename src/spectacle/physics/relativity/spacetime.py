@@ -1,9 +1,13 @@
 from colour import Color
-from typing import Callable, Sequence, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from manim import *
 
+# Imported after manim, whose star import includes its boolean-operation mobject ``Union``.
+from typing import Union
+
 from ...manim_extension.utils.paths import _3d
 from ...manim_extension.utils.consts import BOLD_STROKE_WIDTH
+from .causality import *
 
 
 class FTLError(Exception):
@@ -15,16 +19,31 @@ def make_gamma(v: float):
     return 1 / np.sqrt(1 - (v ** 2))
 
 
-def make_lorentz_transformation(v: float) -> Callable[[np.ndarray], np.ndarray]:
+def make_rapidity(v: float) -> float:
     if abs(v) >= 1:
         raise FTLError(abs(v))
-    gamma = make_gamma(v)
-    return lambda p: _3d(
-        gamma * (p[0] - v * p[1]),
-        gamma * (p[1] - v * p[0]),
+    return np.arctanh(v)
+
+
+def make_boost_matrix(rapidity: float) -> np.ndarray:
+    return np.array(
+        [
+            [np.cosh(rapidity), -np.sinh(rapidity), 0],
+            [-np.sinh(rapidity), np.cosh(rapidity), 0],
+            [0, 0, 1],
+        ]
     )
 
 
+def make_lorentz_matrix(v: float) -> np.ndarray:
+    return make_boost_matrix(make_rapidity(v))
+
+
+def make_lorentz_transformation(v: float) -> Callable[[np.ndarray], np.ndarray]:
+    boost = make_lorentz_matrix(v)[:2, :2]
+    return lambda p: _3d(*np.dot(boost, np.asarray(p, dtype=float)[:2]))
+
+
 class SpacetimeAxes(NumberPlane):
     """Creates a (2D) Minkowski plane with background lines and supports Lorentz transformations.
 
@@ -103,15 +122,17 @@ class SpacetimeAxes(NumberPlane):
         transform_tolerance: float = 0.01,
         **kwargs,
     ):
-        self.__velocity__ = 0
-        self.__prior_velocity__ = 0
-        self.__lorentz_transformation__ = make_lorentz_transformation(self.get_relative_velocity())
-        self.__lorentz_transformation_to_rest__ = make_lorentz_transformation(
-            -1 * self.get_relative_velocity()
-        )
+        # The frame is its rapidity relative to the rest frame; boosts compose by adding it.
+        self.__rapidity__ = 0.0
+        self.__boost__ = np.identity(3)
+        self.__boost_from_rest__ = np.identity(3)
         self.__called_from__: Union[str, None] = None
         self.__transform_tolerance__ = transform_tolerance
-        self.__rest_axes__ = None
+        self.__rest_members__: List[Mobject] = []
+        self.__rest_points__: Optional[List[np.ndarray]] = None
+        self.__rest_frame__: Optional[np.ndarray] = None
+        self.__rest_matrix__ = np.identity(3)
+        self.__rest_offset__ = np.zeros(3)
         super().__init__(
             x_range=x_range,
             y_range=y_range,
@@ -123,44 +144,117 @@ class SpacetimeAxes(NumberPlane):
             make_smooth_after_applying_functions=make_smooth_after_applying_functions,
             **kwargs,
         )
-        self.__rest_axes__ = self.copy()
+        self.__init_rest_frame__()
+
+    def __init_rest_frame__(self):
+        # The rest frame is a read-only snapshot of the family's points and of the points at
+        # the frame coordinates (0, 0), (1, 0) and (0, 1), taken unboosted. Later affine
+        # transformations only update __rest_matrix__ and __rest_offset__, which map the
+        # snapshot to the current rest frame.
+        members = self.family_members_with_points()
+        if self.__rest_frame__ is None:
+            frame = self.__get_frame_points__()
+            matrix, offset = np.identity(3), np.zeros(3)
+        else:
+            frame = self.__get_rest_frame__()
+            matrix, offset = self.__get_boost_map__(frame)
+
+        points = np.concatenate([member.points for member in members])
+        snapshot = np.dot(points - offset, np.linalg.inv(matrix).T)
+        snapshot.flags.writeable = False
+        offsets = np.cumsum([0, *[len(member.points) for member in members]])
+        self.__rest_members__ = members
+        self.__rest_points__ = [snapshot[a:b] for a, b in zip(offsets[:-1], offsets[1:])]
+
+        self.__rest_frame__ = np.array(frame)
+        self.__rest_frame__.flags.writeable = False
+        self.__rest_matrix__ = np.identity(3)
+        self.__rest_offset__ = np.zeros(3)
+
+    def __get_frame_points__(self) -> np.ndarray:
+        # NumberPlane reads these off the axis lines, so they follow every change of the points.
+        return np.array(
+            [NumberPlane.coords_to_point(self, *coords) for coords in [(0, 0), (1, 0), (0, 1)]]
+        )
+
+    def __get_rest_frame__(self) -> np.ndarray:
+        return np.dot(self.__rest_frame__, self.__rest_matrix__.T) + self.__rest_offset__
+
+    def __get_boost_map__(self, frame: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # The boost acts on frame coordinates, so on points it is B conjugated by the rest
+        # frame's affine map: p -> o + L B L^-1 (p - o).
+        basis = np.column_stack([frame[1] - frame[0], frame[2] - frame[0], OUT])
+        matrix = np.dot(basis, np.dot(self.__boost__, np.linalg.inv(basis)))
+        return matrix, frame[0] - np.dot(matrix, frame[0])
+
+    def __sync_rest_frame__(self):
+        # A parent such as Spacetime moves the points of its family directly, without calling
+        # this class, so any affine transformation since the last boost is read back from the
+        # axis lines and composed into the rest map.
+        frame = self.__get_rest_frame__()
+        matrix, offset = self.__get_boost_map__(frame)
+        expected = np.dot(frame, matrix.T) + offset
+        actual = self.__get_frame_points__()
+        frame_map = get_frame_map(expected, actual)
+        if frame_map is None or np.allclose(actual, expected, rtol=0, atol=1e-9):
+            return
+        transform, shift = frame_map
+        self.__rest_matrix__ = np.dot(transform, self.__rest_matrix__)
+        self.__rest_offset__ = np.dot(transform, self.__rest_offset__) + shift
 
     def lorentz_transformation(self, point: Sequence[float]):
-        return self.__lorentz_transformation__(point)
+        return _3d(*np.dot(self.__boost__[:2, :2], np.asarray(point, dtype=float)[:2]))
 
     def lorentz_transformation_to_rest(self, point: Sequence[float]):
-        return self.__lorentz_transformation_to_rest__(point)
+        return _3d(*np.dot(self.__boost_from_rest__[:2, :2], np.asarray(point, dtype=float)[:2]))
 
-    def __update_velocity__(self, new_velocity: float):
-        self.__prior_velocity__ = self.__velocity__
-        self.__velocity__ = new_velocity
-        self.__lorentz_transformation__ = make_lorentz_transformation(self.get_relative_velocity())
-        self.__lorentz_transformation_to_rest__ = make_lorentz_transformation(self.__velocity__)
-        return self
+    def get_rapidity(self):
+        return self.__rapidity__
 
     def get_velocity(self):
-        return self.__velocity__
-
-    def get_relative_velocity(self):
-        v = self.__prior_velocity__
-        u = -self.__velocity__
-        return (v + u) / (1 + v * u)
+        return np.tanh(self.__rapidity__)
+
+    def set_rapidity(self, rapidity: float):
+        if self.__rest_points__ is not None:
+            self.__sync_rest_frame__()
+            members = self.family_members_with_points()
+            if len(members) != len(self.__rest_members__) or any(
+                member is not rest_member
+                for member, rest_member in zip(members, self.__rest_members__)
+            ):
+                self.__init_rest_frame__()
+
+        self.__rapidity__ = rapidity
+        self.__boost__ = make_boost_matrix(-rapidity)
+        self.__boost_from_rest__ = make_boost_matrix(rapidity)
+
+        # Points are always regenerated from the rest frame with one matrix product per
+        # submobject, so no error builds up however many boosts are chained. The snapshot is
+        # first mapped to the current rest frame (M p + t), then boosted (K q + k), written into
+        # the existing arrays.
+        if self.__rest_points__ is None:
+            return self
+        boost, boost_offset = self.__get_boost_map__(self.__get_rest_frame__())
+        matrix = np.dot(boost, self.__rest_matrix__)
+        offset = np.dot(boost, self.__rest_offset__) + boost_offset
+        for mobject, rest_points in zip(self.__rest_members__, self.__rest_points__):
+            points = mobject.points
+            if points.shape != rest_points.shape or not points.flags.c_contiguous:
+                mobject.points = np.empty_like(rest_points)
+            np.dot(rest_points, matrix.T, out=mobject.points)
+            mobject.points += offset
+        return self
 
     def apply_lorentz_transformation(self, velocity: float):
+        return self.set_rapidity(make_rapidity(velocity))
 
-        self.__update_velocity__(velocity)
-
-        # prior_origin = .get_origin()
-        # new_origin = self..get_origin()
-        # return self.shift(new_origin - prior_origin)
-        return self.apply_function(self.lorentz_transformation)
+    def boost(self, velocity: float):
+        return self.set_rapidity(self.get_rapidity() + make_rapidity(velocity))
 
     @override_animate(apply_lorentz_transformation)
     def _apply_lorentz_transformation_animation(self, velocity: float, anim_args=None):
         anim_args = anim_args if anim_args is not None else {}
-        original = self.copy()
-        self.apply_lorentz_transformation(velocity)
-        return original.become(self)
+        return LorentzBoost(self, velocity, **anim_args)
 
     def apply_function(self, function):
         self.__called_from__ = self.apply_function.__name__
@@ -169,16 +263,15 @@ class SpacetimeAxes(NumberPlane):
         return out
 
     def get_rest_axes(self):
-        return self.__rest_axes__
+        return self.copy().set_rapidity(0)
 
-    def shift(self, *vectors: np.ndarray):
-        if self.__rest_axes__ is not None:
-            self.__rest_axes__.shift(*vectors)
-        return super().shift(*vectors)
+    def get_rest_frame(self) -> np.ndarray:
+        """Returns the rest-frame points of the origin and of ``(1, 0)`` and ``(0, 1)``."""
+        if self.__rest_points__ is not None:
+            self.__sync_rest_frame__()
+        return self.__get_rest_frame__()
 
     def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
-        if self.__rest_axes__ is not None and self.__called_from__ != self.apply_function.__name__:
-            self.__rest_axes__.apply_points_function_about_point(func, about_point, about_edge)
         if self.__called_from__ == self.apply_function.__name__:
             about_point = self.get_origin()
         return super().apply_points_function_about_point(func, about_point, about_edge)
@@ -186,29 +279,14 @@ class SpacetimeAxes(NumberPlane):
     def point_to_coords(self, point: Sequence[float]) -> Tuple[float]:
         if abs(self.get_velocity()) < self.__transform_tolerance__:
             return super().point_to_coords(point)
-        untransformed_coords_from_point = self.get_rest_axes().point_to_coords(point)
-
-        transformed_from_untransformed_coords = self.lorentz_transformation_to_rest(
-            untransformed_coords_from_point
-        )
-
-        return (
-            transformed_from_untransformed_coords[0],
-            transformed_from_untransformed_coords[1],
-        )
+        x, y = self.points_to_coords([point])[0]
+        return x, y
 
     def coords_to_point(self, *coords: Sequence[float]) -> np.ndarray:
         if abs(self.get_velocity()) < self.__transform_tolerance__:
             point = super().coords_to_point(*coords)
             return point
-
-        untransformed_from_transformed_coords = self.lorentz_transformation(coords)
-
-        point_from_untransformed_coords = self.get_rest_axes().coords_to_point(
-            *untransformed_from_transformed_coords
-        )
-
-        return point_from_untransformed_coords
+        return self.coords_to_points([coords[:2]])[0]
 
     def c2p(self, *coords):
         return self.coords_to_point(*coords)
@@ -216,23 +294,340 @@ class SpacetimeAxes(NumberPlane):
     def p2c(self, point):
         return self.point_to_coords(point)
 
-    def get_line_from_axis_to_point(
+    def coords_to_points(self, coords: np.ndarray) -> np.ndarray:
+        """Maps ``(N, 2)`` frame coordinates to ``(N, 3)`` points: the boost to rest coordinates
+        and the rest axes' affine map are each one matrix product over the whole array."""
+        coords = np.atleast_2d(np.asarray(coords, dtype=float))[:, :2]
+        origin, x_point, y_point = self.get_rest_frame()
+        rest_coords = np.dot(coords, self.__boost__[:2, :2].T)
+        return origin + np.dot(rest_coords, np.array([x_point - origin, y_point - origin]))
+
+    def points_to_coords(self, points: np.ndarray) -> np.ndarray:
+        """Maps ``(N, 3)`` points to ``(N, 2)`` frame coordinates; the inverse of
+        :meth:`coords_to_points`."""
+        return np.dot(self.points_to_rest_coords(points), self.__boost_from_rest__[:2, :2].T)
+
+    def points_to_rest_coords(self, points: np.ndarray) -> np.ndarray:
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        origin, x_point, y_point = self.get_rest_frame()
+        basis = np.array([x_point - origin, y_point - origin])[:, :2]
+        return np.linalg.solve(basis.T, (points - origin)[:, :2].T).T
+
+    def get_lines_from_axis_to_points(
         self,
         index: int,
-        point: Sequence[float],
+        points: np.ndarray,
         line_func: Line = DashedLine,
         line_config: Optional[Dict] = None,
         color: Color = LIGHT_GREY,
         stroke_width: float = 2,
-    ) -> "Line":
+    ) -> List[Line]:
         line_config = line_config if line_config is not None else {}
         line_config["color"] = color
         line_config["stroke_width"] = stroke_width
-        x_coord, y_coord = self.p2c(point)
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        return [
+            line_func(axis_point, point, **line_config)
+            for axis_point, point in zip(self.get_axis_points(index, points), points)
+        ]
+
+    def get_axis_points(self, index: int, points: np.ndarray) -> np.ndarray:
+        """Returns the feet of the projections of ``points`` onto axis ``index``."""
+        axis_coords = self.points_to_coords(points)
+        axis_coords[:, 1 - index] = 0
+        return self.coords_to_points(axis_coords)
+
+    def get_line_from_axis_to_point(
+        self,
+        index: int,
+        point: Sequence[float],
+        line_func: Line = DashedLine,
+        line_config: Optional[Dict] = None,
+        color: Color = LIGHT_GREY,
+        stroke_width: float = 2,
+    ) -> "Line":
+        return self.get_lines_from_axis_to_points(
+            index, [point], line_func, line_config, color, stroke_width
+        )[0]
+
+
+def get_segment_map(
+    start: np.ndarray, end: np.ndarray, new_start: np.ndarray, new_end: np.ndarray
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Returns the matrix and offset of the rotation and scaling in the xy plane that carries the
+    segment from ``start`` to ``end`` onto the one from ``new_start`` to ``new_end``, or ``None``
+    if either segment has no length."""
+    direction, new_direction = (end - start)[:2], (new_end - new_start)[:2]
+    length_sq = np.dot(direction, direction)
+    if length_sq < 1e-12 or np.dot(new_direction, new_direction) < 1e-12:
+        return None
+    a = np.dot(direction, new_direction) / length_sq
+    b = (direction[0] * new_direction[1] - direction[1] * new_direction[0]) / length_sq
+    matrix = np.array([[a, -b, 0], [b, a, 0], [0, 0, 1]])
+    return matrix, new_start - np.dot(matrix, start)
+
+
+def get_frame_map(
+    frame: np.ndarray, new_frame: np.ndarray
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Returns the matrix and offset of the affine map of the xy plane that carries the three
+    points of ``frame`` onto those of ``new_frame``, or ``None`` if ``frame`` is degenerate."""
+    basis = (frame[1:] - frame[0])[:, :2]
+    if abs(np.linalg.det(basis)) < 1e-12:
+        return None
+    matrix = np.identity(3)
+    matrix[:2, :2] = np.linalg.solve(basis, (new_frame[1:] - new_frame[0])[:, :2]).T
+    return matrix, new_frame[0] - np.dot(matrix, frame[0])
+
+
+def get_polyline_curves(vertices: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Returns the straight cubic Bézier curves through every polyline of ``vertices``, where
+    polyline ``i`` is ``vertices[offsets[i]:offsets[i + 1]]``, as one ``(C, 4, 3)`` array."""
+    is_start = np.ones(len(vertices), dtype=bool)
+    is_start[offsets[1:] - 1] = False
+    starts = np.flatnonzero(is_start)
+    start_points, end_points = vertices[starts], vertices[starts + 1]
+    return np.stack(
+        [
+            start_points,
+            start_points + (end_points - start_points) / 3,
+            start_points + 2 * (end_points - start_points) / 3,
+            end_points,
+        ],
+        axis=1,
+    )
+
+
+class WorldlineEnsemble(VGroup):
+    """Many worldlines held in one contiguous vertex array with an offsets index.
+
+    Worldline ``i`` is the polyline ``vertices[offsets[i]:offsets[i + 1]]``. Worldlines that share
+    a color and stroke width are drawn as the subpaths of a single :class:`VMobject`, so a swarm
+    of thousands of particles renders with one draw call per style. Transformations, including
+    Lorentz boosts, are applied once to the whole vertex array and the batches are rebuilt from
+    it with one gather per style.
+
+    Parameters
+    ----------
+    axes
+        The axes the trajectory coordinates are given in.
+    trajectories
+        One ``(K, 2)`` array of ``(x, ct)`` coordinates per worldline.
+    names
+        The names used to look worldlines up; defaults to their indices.
+    colors
+        One color for every worldline, or a single color for all of them.
+    stroke_widths
+        One stroke width for every worldline, or a single width for all of them.
+    kwargs : Any
+        Additional arguments to be passed to :class:`VGroup`.
+    """
+
+    def __init__(
+        self,
+        axes: SpacetimeAxes,
+        trajectories: Sequence[np.ndarray],
+        names: Optional[Sequence[str]] = None,
+        colors: Union[Color, Sequence[Color]] = YELLOW,
+        stroke_widths: Union[float, Sequence[float]] = DEFAULT_STROKE_WIDTH,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.axes = axes
+        self.rapidity = 0.0
+        trajectories = [np.asarray(coords, dtype=float).reshape(-1, 2) for coords in trajectories]
+        self.offsets = np.cumsum([0, *[len(coords) for coords in trajectories]])
+        self.vertices = axes.coords_to_points(
+            np.concatenate(trajectories) if trajectories else np.zeros((0, 2))
+        )
 
-        axis_pt = [lambda: self.c2p(x_coord, 0), lambda: self.c2p(0, y_coord)][index]()
-        line = line_func(axis_pt, point, **line_config)
-        return line
+        self.names = [str(n) for n in range(len(trajectories))] if names is None else list(names)
+        self.name_index: Dict[str, int] = {name: index for index, name in enumerate(self.names)}
+        count = len(trajectories)
+        self.colors = list(colors) if isinstance(colors, (list, tuple)) else [colors] * count
+        self.stroke_widths = np.broadcast_to(np.asarray(stroke_widths, dtype=float), (count,))
+
+        # Curve ``c`` of the Bézier array belongs to worldline ``curve_owner[c]``; each style batch
+        # gathers the points of its worldlines' curves with one index array.
+        curve_counts = np.maximum(np.diff(self.offsets) - 1, 0)
+        curve_owner = np.repeat(np.arange(count), curve_counts)
+        styles: Dict[tuple, List[int]] = {}
+        for index in range(count):
+            key = (str(self.colors[index]), float(self.stroke_widths[index]))
+            styles.setdefault(key, []).append(index)
+
+        self.batch_indices: List[np.ndarray] = []
+        for members in styles.values():
+            curves = np.flatnonzero(np.isin(curve_owner, members))
+            self.batch_indices.append((4 * curves[:, np.newaxis] + np.arange(4)).ravel())
+            self.add(
+                VMobject().set_stroke(
+                    self.colors[members[0]], width=self.stroke_widths[members[0]]
+                )
+            )
+        self.update_batches()
+
+    def update_batches(self):
+        points = get_polyline_curves(self.vertices, self.offsets).reshape(-1, 3)
+        for batch, indices in zip(self.submobjects, self.batch_indices):
+            batch.set_points(points[indices])
+        return self
+
+    def sync_vertices(self):
+        """Reads the vertices back from the batches, which a parent mobject may have moved
+        directly. Batches whose point count has changed, e.g. while being created, are skipped."""
+        is_end = np.zeros(len(self.vertices), dtype=bool)
+        is_end[self.offsets[1:] - 1] = True
+        curve_starts = np.flatnonzero(~is_end)
+        for batch, indices in zip(self.submobjects, self.batch_indices):
+            if len(batch.points) == len(indices) > 0:
+                curves = batch.points.reshape(-1, 4, 3)
+                starts = curve_starts[indices[::4] // 4]
+                self.vertices[starts] = curves[:, 0]
+                self.vertices[starts + 1] = curves[:, 3]
+        return self
+
+    def get_index(self, member: Union[int, str]) -> int:
+        return self.name_index[member] if isinstance(member, str) else member
+
+    def get_worldline_points(self, member: Union[int, str]) -> np.ndarray:
+        index = self.get_index(member)
+        self.sync_vertices()
+        return self.vertices[self.offsets[index] : self.offsets[index + 1]]
+
+    def points_from_proportions(
+        self, members: Sequence[Union[int, str]], alphas: Sequence[float]
+    ) -> np.ndarray:
+        """Returns the points at proportions ``alphas`` of the arc length of each member."""
+        indices = np.array([self.get_index(member) for member in members], dtype=int)
+        self.sync_vertices()
+        owner = np.repeat(np.arange(len(self.names)), np.diff(self.offsets))
+        lengths = np.linalg.norm(np.diff(self.vertices, axis=0), axis=1)
+        lengths[owner[1:] != owner[:-1]] = 0
+        cumulative = np.concatenate([[0], np.cumsum(lengths)])
+        cumulative -= cumulative[self.offsets[:-1]][owner]
+        totals = cumulative[self.offsets[1:] - 1]
+        totals[totals <= 0] = 1
+
+        # Worldline ``i`` at proportion ``alpha`` is found at ``i + alpha`` in a single table.
+        table = owner + cumulative / totals[owner]
+        targets = indices + np.clip(alphas, 0, 1)
+        starts = np.searchsorted(table, targets, side="right") - 1
+        last_starts = np.maximum(self.offsets[indices + 1] - 2, self.offsets[indices])
+        starts = np.clip(starts, self.offsets[indices], last_starts)
+        ends = np.minimum(starts + 1, self.offsets[indices + 1] - 1)
+        spans = np.where(table[ends] > table[starts], table[ends] - table[starts], 1)
+        t = np.clip((targets - table[starts]) / spans, 0, 1)[:, np.newaxis]
+        return self.vertices[starts] + t * (self.vertices[ends] - self.vertices[starts])
+
+    def point_from_member_proportion(self, member: Union[int, str], alpha: float) -> np.ndarray:
+        return self.points_from_proportions([member], [alpha])[0]
+
+    def shift(self, *vectors: np.ndarray):
+        self.sync_vertices()
+        self.vertices = self.vertices + np.sum(vectors, axis=0)
+        return self.update_batches()
+
+    def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+        if about_point is None:
+            about_edge = about_edge if about_edge is not None else ORIGIN
+            about_point = self.get_critical_point(about_edge)
+        self.sync_vertices()
+        self.vertices = func(self.vertices - about_point) + about_point
+        return self.update_batches()
+
+    def get_rapidity(self) -> float:
+        return self.rapidity
+
+    def set_rapidity(self, rapidity: float):
+        """Boosts the worldlines into the frame of ``rapidity`` about the origin of :attr:`axes`.
+
+        The boost is the one :class:`SpacetimeAxes` draws its grid with, ``make_boost_matrix`` of
+        ``-rapidity`` in the coordinates of the axes, so worldlines boosted together with their
+        axes keep their coordinates.
+        """
+        origin = self.axes.c2p(0, 0)
+        basis = np.column_stack([self.axes.c2p(1, 0) - origin, self.axes.c2p(0, 1) - origin, OUT])
+        matrix = basis @ make_boost_matrix(self.rapidity - rapidity) @ np.linalg.inv(basis)
+        self.rapidity = rapidity
+        return self.apply_matrix(matrix, about_point=origin)
+
+    def apply_lorentz_transformation(self, velocity: float):
+        return self.set_rapidity(make_rapidity(velocity))
+
+    def boost(self, velocity: float):
+        return self.set_rapidity(self.rapidity + make_rapidity(velocity))
+
+
+def get_proper_times(coords: np.ndarray) -> np.ndarray:
+    """Returns the proper time elapsed at every sample of a worldline of ``(x, ct)`` coordinates,
+    as the cumulative sum of the intervals of its straight segments."""
+    coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+    intervals = get_intervals(coords[:-1], coords[1:])
+    if np.any(intervals < 0):
+        delta = np.diff(coords, axis=0)
+        raise FTLError(np.max(np.abs(delta[:, 0]) / np.maximum(np.abs(delta[:, 1]), 1e-12)))
+    return np.concatenate([[0], np.cumsum(np.sqrt(intervals))])
+
+
+class ProperTimeWorldline(VMobject):
+    """A worldline through sampled ``(x, ct)`` coordinates, parameterized by proper time.
+
+    The proper time at every sample is integrated once into a lookup table, so any number of
+    points can be placed at given proper times with one binary search and linear interpolation
+    along the drawn segments. Proper time is invariant, so the table stays valid when the
+    worldline is boosted or moved.
+
+    Parameters
+    ----------
+    axes
+        The axes the coordinates are given in.
+    coords
+        The ``(K, 2)`` array of ``(x, ct)`` coordinates, ordered in time, with ``K >= 2``.
+    proper_times
+        The proper time at each sample when it is known exactly, as for hyperbolic motion; by
+        default it is integrated with :func:`get_proper_times`.
+    kwargs : Any
+        Additional arguments to be passed to :class:`VMobject`.
+    """
+
+    def __init__(
+        self,
+        axes: SpacetimeAxes,
+        coords: np.ndarray,
+        proper_times: Optional[np.ndarray] = None,
+        **kwargs,
+    ):
+        coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        if len(coords) < 2:
+            raise Exception(f"A worldline needs at least 2 samples, got {len(coords)}")
+        self.proper_times = (
+            get_proper_times(coords)
+            if proper_times is None
+            else np.asarray(proper_times, dtype=float)
+        )
+        super().__init__(**kwargs)
+        self.set_points_as_corners(axes.coords_to_points(coords))
+
+    def get_proper_time(self) -> float:
+        return self.proper_times[-1]
+
+    def get_sample_points(self) -> np.ndarray:
+        # Each straight segment is one cubic curve, so the samples are the curves' anchors.
+        return np.concatenate([self.points[::4], self.points[-1:]])
+
+    def points_at_proper_times(self, proper_times: Sequence[float]) -> np.ndarray:
+        """Returns the points reached at each of ``proper_times``, clamped to the worldline."""
+        table = self.proper_times
+        proper_times = np.clip(np.asarray(proper_times, dtype=float), table[0], table[-1])
+        starts = np.clip(np.searchsorted(table, proper_times, side="right") - 1, 0, len(table) - 2)
+        spans = table[starts + 1] - table[starts]
+        t = np.where(spans > 0, (proper_times - table[starts]) / np.where(spans > 0, spans, 1), 0)
+        samples = self.get_sample_points()
+        return samples[starts] + t[:, np.newaxis] * (samples[starts + 1] - samples[starts])
+
+    def point_at_proper_time(self, proper_time: float) -> np.ndarray:
+        return self.points_at_proper_times([proper_time])[0]
 
 
 class Spacetime(VGroup):
@@ -254,9 +649,17 @@ class Spacetime(VGroup):
         self.axis_labels = self.axes.get_axis_labels("x", "ct")
         self.worldlines: dict[str, TipableVMobject] = {}
         self.events: dict[str, Dot] = {}
+        self.event_store = EventStore()
         self.event_alphas: dict[str, float] = {}
         self.intervals: dict[str, VGroup] = {}
         self.projections: dict[str, Tuple[Line, Line]] = {}
+        # The frame state each projection and the axis labels were last laid out for, so a
+        # change of frame only touches what depends on it.
+        self.projection_endpoints: dict[str, np.ndarray] = {}
+        self.projection_rapidities: dict[str, float] = {}
+        self.projection_frame: Optional[np.ndarray] = None
+        self.label_rapidity = 0.0
+        self.ensembles: dict[str, WorldlineEnsemble] = {}
         super().__init__(*[self.axes, *self.axis_labels])
 
     def get_all_spacetime_objects(self):
@@ -296,15 +699,94 @@ class Spacetime(VGroup):
             name, self._make_worldline_from_coords(*args), anim_args
         )
 
-    def add_event(self, name: str, *coords: Sequence[float]):
-        self.events[name] = self.event_style_func(
-            Dot(
-                point=self.axes.c2p(*coords),
-            )
+    def _make_worldline_from_function(
+        self,
+        function: Callable[[np.ndarray], np.ndarray],
+        t_range: Optional[Sequence[float]] = None,
+        samples=256,
+    ):
+        t = np.linspace(*(self.axes.y_range[:2] if t_range is None else t_range), samples)
+        x = np.broadcast_to(np.asarray(function(t), dtype=float), t.shape)
+        return ProperTimeWorldline(
+            self.axes, np.stack([x, t], axis=1), stroke_width=BOLD_STROKE_WIDTH, color=YELLOW
         )
-        self.add(self.events[name])
+
+    def add_worldline_from_function(self, name: str, *args, **kwargs):
+        """Adds the worldline ``x = function(ct)``, sampled at ``samples`` times in ``t_range``
+        (the time axis by default). ``function`` is called once with the array of times."""
+        return self.add_worldline(name, self._make_worldline_from_function(*args, **kwargs))
+
+    @override_animate(add_worldline_from_function)
+    def _add_worldline_from_function_animation(self, name: str, *args, anim_args=None, **kwargs):
+        anim_args = anim_args if anim_args is not None else {}
+        return self._add_worldline_animation(
+            name, self._make_worldline_from_function(*args, **kwargs), anim_args
+        )
+
+    def _make_accelerated_worldline(
+        self,
+        acceleration: float,
+        proper_time_range: Sequence[float] = (0, 1),
+        start_coord: Sequence[float] = (0, 0),
+        samples=256,
+    ):
+        # Hyperbolic motion, at rest at ``start_coord`` when the proper time is 0.
+        tau = np.linspace(*proper_time_range, samples)
+        if acceleration == 0:
+            x, t = np.zeros_like(tau), tau
+        else:
+            x = (np.cosh(acceleration * tau) - 1) / acceleration
+            t = np.sinh(acceleration * tau) / acceleration
+        return ProperTimeWorldline(
+            self.axes,
+            np.stack([x, t], axis=1) + start_coord,
+            proper_times=tau,
+            stroke_width=BOLD_STROKE_WIDTH,
+            color=YELLOW,
+        )
+
+    def add_accelerated_worldline(self, name: str, *args, **kwargs):
+        """Adds the worldline of a constant proper ``acceleration`` (in units of c^2 per unit
+        length) over ``proper_time_range``, starting at rest from ``start_coord``."""
+        return self.add_worldline(name, self._make_accelerated_worldline(*args, **kwargs))
+
+    @override_animate(add_accelerated_worldline)
+    def _add_accelerated_worldline_animation(self, name: str, *args, anim_args=None, **kwargs):
+        anim_args = anim_args if anim_args is not None else {}
+        return self._add_worldline_animation(
+            name, self._make_accelerated_worldline(*args, **kwargs), anim_args
+        )
+
+    def add_worldline_ensemble(self, name: str, trajectories: Sequence[np.ndarray], **kwargs):
+        self.ensembles[name] = WorldlineEnsemble(self.axes, trajectories, **kwargs)
+        self.add(self.ensembles[name])
         return self
 
+    def add_events_to_ensemble(
+        self,
+        event_names: Sequence[str],
+        ensemble_name: str,
+        members: Sequence[Union[int, str]],
+        alphas: Sequence[float],
+    ):
+        if ensemble_name not in self.ensembles:
+            raise Exception(f"No worldline ensemble found for name {ensemble_name}")
+        points = self.ensembles[ensemble_name].points_from_proportions(members, alphas)
+        return self._add_event_dots(event_names, points)
+
+    def add_events(self, names: Sequence[str], coords: np.ndarray):
+        return self._add_event_dots(names, self.axes.coords_to_points(coords))
+
+    def _add_event_dots(self, names: Sequence[str], points: np.ndarray):
+        self.event_store.add_events(names, self.axes.points_to_rest_coords(points))
+        for name, point in zip(names, points):
+            self.events[name] = self.event_style_func(Dot(point=point))
+        self.add(*[self.events[name] for name in names])
+        return self
+
+    def add_event(self, name: str, *coords: Sequence[float]):
+        return self.add_events([name], [coords])
+
     @override_animate(add_event)
     def _add_event_animation(self, name: str, *args, anim_args=None):
         anim_args = anim_args if anim_args is not None else {}
@@ -317,11 +799,7 @@ class Spacetime(VGroup):
         worldline = self.worldlines[worldline_name]
 
         self.event_alphas[event_name] = alpha
-        self.events[event_name] = self.event_style_func(
-            Dot(worldline.point_from_proportion(self.event_alphas[event_name]))
-        )
-        self.add(self.events[event_name])
-        return self
+        return self._add_event_dots([event_name], [worldline.point_from_proportion(alpha)])
 
     @override_animate(add_event_to_worldline)
     def _add_event_to_worldline_animation(self, event_name: str, *args, anim_args=None):
@@ -329,14 +807,85 @@ class Spacetime(VGroup):
         self.add_event_to_worldline(event_name, *args)
         return Create(self.events[event_name], **anim_args)
 
+    def add_events_at_proper_times(
+        self, event_names: Sequence[str], worldline_name: str, proper_times: Sequence[float]
+    ):
+        worldline = self.worldlines.get(worldline_name)
+        if not isinstance(worldline, ProperTimeWorldline):
+            raise Exception(f"No proper time worldline found for name {worldline_name}")
+        return self._add_event_dots(event_names, worldline.points_at_proper_times(proper_times))
+
+    def add_event_at_proper_time(self, event_name: str, worldline_name: str, proper_time: float):
+        return self.add_events_at_proper_times([event_name], worldline_name, [proper_time])
+
+    @override_animate(add_event_at_proper_time)
+    def _add_event_at_proper_time_animation(self, event_name: str, *args, anim_args=None):
+        anim_args = anim_args if anim_args is not None else {}
+        self.add_event_at_proper_time(event_name, *args)
+        return Create(self.events[event_name], **anim_args)
+
     def add_event_projection(self, event_name: str):
+        self._sync_projection_endpoints()
         event_point = self.events[event_name].get_center()
         x_project = self.axes.get_line_from_axis_to_point(0, event_point)
         y_project = self.axes.get_line_from_axis_to_point(1, event_point)
         self.projections[event_name] = (x_project, y_project)
+        self.projection_endpoints[event_name] = np.array(
+            [[self.axes.get_axis_points(index, event_point)[0], event_point] for index in [0, 1]]
+        )
+        self.projection_rapidities[event_name] = self.get_rapidity()
         self.add(x_project, y_project)
         return self
 
+    def _sync_projection_endpoints(self):
+        # Transformations of a parent move the projections without updating their recorded
+        # endpoints, but they move the axes' rest frame in the same way.
+        frame = self.axes.get_rest_frame()
+        if self.projection_frame is not None:
+            frame_map = get_frame_map(self.projection_frame, frame)
+            if frame_map is not None and not np.allclose(frame, self.projection_frame):
+                matrix, offset = frame_map
+                for endpoints in self.projection_endpoints.values():
+                    endpoints[:] = np.dot(endpoints, matrix.T) + offset
+        self.projection_frame = frame
+
+    def update_projections(self):
+        """Moves the projections whose event or frame changed since they were laid out.
+
+        The feet of all of them are found with two batched calls. Each dashed line is then
+        carried onto its new endpoints by moving its existing dash points, so no mobject is
+        built. Only lines that shrink to or grow from zero length are rebuilt.
+        """
+        self._sync_projection_endpoints()
+        rapidity = self.get_rapidity()
+        names = [
+            name
+            for name in self.projections
+            if self.projection_rapidities[name] != rapidity
+            or not np.allclose(
+                self.events[name].get_center(), self.projection_endpoints[name][0, 1]
+            )
+        ]
+        if len(names) == 0:
+            return self
+
+        event_points = np.array([self.events[name].get_center() for name in names])
+        axis_points = [self.axes.get_axis_points(index, event_points) for index in [0, 1]]
+        for row, name in enumerate(names):
+            endpoints = self.projection_endpoints[name]
+            for index, line in enumerate(self.projections[name]):
+                new_start, new_end = axis_points[index][row], event_points[row]
+                segment_map = get_segment_map(*endpoints[index], new_start, new_end)
+                if segment_map is None:
+                    line.become(self.axes.get_line_from_axis_to_point(index, new_end))
+                else:
+                    matrix, offset = segment_map
+                    for member in line.family_members_with_points():
+                        member.points[:] = np.dot(member.points, matrix.T) + offset
+                endpoints[index] = new_start, new_end
+            self.projection_rapidities[name] = rapidity
+        return self
+
     @override_animate(add_event_projection)
     def _add_event_projection_animation(self, event_name: str, anim_args=None):
         anim_args = anim_args if anim_args is not None else {}
@@ -354,20 +903,61 @@ class Spacetime(VGroup):
             self.axis_labels[index].become(new_axis_labels[index])
         return self
 
+    def get_rapidity(self):
+        return self.axes.get_rapidity()
+
+    def set_rapidity(self, rapidity: float):
+        self.axes.set_rapidity(rapidity)
+
+        if self.label_rapidity != rapidity:
+            for index in [0, 1]:
+                axis = self.axes.get_axes()[index]
+                self.axis_labels[index].move_to(
+                    ([1.05, 1.1])[index] * (axis.get_end() - axis.get_start()) + axis.get_start()
+                )
+            self.label_rapidity = rapidity
+        return self.update_projections()
+
     def apply_lorentz_transformation(self, velocity: float):
-        self.axes.apply_lorentz_transformation(velocity)
+        return self.set_rapidity(make_rapidity(velocity))
 
-        for index in [0, 1]:
-            axis = self.axes.get_axes()[index]
-            self.axis_labels[index].move_to(
-                ([1.05, 1.1])[index] * (axis.get_end() - axis.get_start()) + axis.get_start()
-            )
-        for event_name, (x_project, y_project) in self.projections.items():
-            event_point = self.events[event_name].get_center()
-            new_x_project = self.axes.get_line_from_axis_to_point(0, event_point)
-            new_y_project = self.axes.get_line_from_axis_to_point(1, event_point)
+    @override_animate(apply_lorentz_transformation)
+    def _apply_lorentz_transformation_animation(self, velocity: float, anim_args=None):
+        anim_args = anim_args if anim_args is not None else {}
+        return LorentzBoost(self, velocity, **anim_args)
 
-            x_project.become(new_x_project)
-            y_project.become(new_y_project)
 
-        return self
+class LorentzBoost(Animation):
+    """Boosts a :class:`Spacetime` or :class:`SpacetimeAxes` continuously into the frame moving
+    at ``velocity``.
+
+    The rapidity is interpolated over time, so every intermediate frame is a real Lorentz frame
+    rather than a blend of two end states. Each frame rewrites the points from the cached rest
+    frame in place, and the mobject is never copied.
+
+    Parameters
+    ----------
+    mobject
+        The spacetime or axes to boost.
+    velocity
+        The velocity of the target frame relative to the rest frame, as a fraction of c.
+    kwargs : Any
+        Additional arguments to be passed to :class:`Animation`.
+    """
+
+    def __init__(self, mobject: Union[Spacetime, SpacetimeAxes], velocity: float, **kwargs):
+        self.target_rapidity = make_rapidity(velocity)
+        super().__init__(mobject, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        return self.mobject
+
+    def begin(self):
+        self.start_rapidity = self.mobject.get_rapidity()
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        alpha = self.rate_func(alpha)
+        self.mobject.set_rapidity(
+            self.start_rapidity + alpha * (self.target_rapidity - self.start_rapidity)
+        )
@@ -0,0 +1,78 @@
+import itertools
+import pytest
+from spectacle import *
+
+
+def make_store():
+    points = list(itertools.product(range(-3, 4), range(-3, 4)))
+    rng = np.random.default_rng(0)
+    coords = np.array([points[index] for index in rng.permutation(len(points))[:30]], dtype=float)
+    return EventStore().add_events([f"e{n}" for n in range(len(coords))], coords), coords
+
+
+def get_interval(coords1, coords2) -> float:
+    return (coords2[1] - coords1[1]) ** 2 - (coords2[0] - coords1[0]) ** 2
+
+
+def get_interval_type(interval: float) -> int:
+    if interval == 0:
+        return LIGHTLIKE
+    return TIMELIKE if interval > 0 else SPACELIKE
+
+
+def test_classify_intervals():
+    coords = np.array([[0, 0], [1, 1], [0, 2], [3, 1]])
+    intervals = get_intervals(coords[0], coords)
+    assert np.allclose(intervals, [0, 0, 4, -8])
+    assert list(classify_intervals(intervals[1:])) == [LIGHTLIKE, TIMELIKE, SPACELIKE]
+
+
+def test_event_store_matrices():
+    store, coords = make_store()
+    expected = np.array([[get_interval(a, b) for b in coords] for a in coords])
+    assert np.allclose(store.get_interval_matrix(), expected)
+    assert np.all(store.get_interval_types() == np.vectorize(get_interval_type)(expected))
+    assert {SPACELIKE, LIGHTLIKE, TIMELIKE} <= set(store.get_interval_types().ravel())
+
+    rows = ["e3", 7, "e12"]
+    indices = [3, 7, 12]
+    assert np.allclose(store.get_interval_matrix(rows), expected[indices])
+    assert np.all(store.get_interval_types(rows) == store.get_interval_types()[indices])
+    assert np.all(store.get_causal_matrix(rows) == store.get_causal_matrix()[indices])
+    assert np.all(store.classify(rows, ["e0"] * 3) == store.get_interval_types()[indices, 0])
+
+
+def test_event_store_causal_queries():
+    store, coords = make_store()
+    for i, j in itertools.product(range(len(coords)), repeat=2):
+        causal = coords[j, 1] > coords[i, 1] and get_interval(coords[i], coords[j]) >= 0
+        assert store.get_causal_matrix()[i, j] == causal
+        assert store.precedes(i, j) == causal
+
+    for i in range(len(coords)):
+        future = {f"e{j}" for j in range(len(coords)) if store.precedes(i, j)}
+        past = {f"e{j}" for j in range(len(coords)) if store.precedes(j, i)}
+        assert set(store.get_future(i)) == future
+        assert set(store.get_past(f"e{i}")) == past
+
+    order = store.get_causal_order()
+    assert all(
+        order.index(f"e{i}") < order.index(f"e{j}")
+        for i, j in itertools.product(range(len(coords)), repeat=2)
+        if store.precedes(i, j)
+    )
+
+
+def test_event_store_region():
+    store, coords = make_store()
+    inside = (np.abs(coords[:, 0]) <= 1) & (coords[:, 1] >= 0) & (coords[:, 1] <= 2)
+    assert set(store.get_region([-1, 1], [0, 2])) == set(np.flatnonzero(inside))
+    assert set(store.get_time_slice(1, 1)) == set(np.flatnonzero(coords[:, 1] == 1))
+
+
+def test_event_store_limits_full_matrices():
+    store, coords = make_store()
+    store.max_matrix_events = 10
+    with pytest.raises(Exception):
+        store.get_interval_matrix()
+    assert store.get_interval_matrix(["e1"]).shape == (1, len(coords))
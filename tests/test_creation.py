@@ -0,0 +1,43 @@
+import pytest
+from spectacle import *
+from spectacle.manim_extension.animation.creation import get_bezier_lengths, split_bezier_curves
+
+
+def make_members():
+    return [Line(ORIGIN, RIGHT), Square(), Line(UP, 3 * UP + RIGHT)]
+
+
+def get_length(mobject: VMobject) -> float:
+    return get_bezier_lengths(mobject.points.reshape(-1, 4, 3)).sum()
+
+
+def test_split_bezier_curves():
+    curves = Square().points.reshape(-1, 4, 3)
+    split = split_bezier_curves(curves, np.array([0, 0.25, 0.5, 1]))
+    assert np.allclose(split[0], curves[0, 0])
+    assert np.allclose(split[1, 3], interpolate(curves[1, 0], curves[1, 3], 0.25))
+    assert np.allclose(split[3], curves[3])
+
+
+@pytest.mark.parametrize("alpha", [0.3, 0.7])
+def test_batched_create_matches_create(alpha):
+    members = make_members()
+    animation = BatchedCreate(*members, rate_func=linear)
+    animation.begin()
+    animation.interpolate(alpha)
+    for member, expected in zip(members, make_members()):
+        create = Create(expected, rate_func=linear)
+        create.begin()
+        create.interpolate(alpha)
+        assert np.isclose(get_length(member), get_length(expected))
+        assert np.allclose(member.get_end(), expected.get_end())
+
+
+def test_batched_create_finish_restores_points():
+    members = make_members()
+    animation = BatchedCreate(*members)
+    animation.begin()
+    animation.interpolate(0.4)
+    animation.finish()
+    for member, expected in zip(members, make_members()):
+        assert np.allclose(member.points, expected.points)
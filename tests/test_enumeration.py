@@ -0,0 +1,61 @@
+from spectacle import *
+import pytest
+
+
+def get_vertex_lines(graph):
+    lines = {}
+    for (start, end), particle in zip(graph.edges, graph.edge_particles):
+        lines.setdefault(start, []).append((particle, 1))
+        lines.setdefault(end, []).append((particle, -1))
+    return {
+        graph.vertices[vertex]: vertex_lines
+        for vertex, vertex_lines in lines.items()
+        if graph.vertices[vertex] not in graph.incoming + graph.outgoing
+    }
+
+
+@pytest.mark.parametrize(
+    "incoming, outgoing, count",
+    [
+        ([ELECTRON, ELECTRON], [ELECTRON, ELECTRON], 3),
+        ([ELECTRON, ELECTRON], [QUARK, QUARK], 1),
+        ([ELECTRON, PHOTON], [ELECTRON, PHOTON], 2),
+        ([QUARK, QUARK], [GLUON, GLUON], 3),
+        ([ELECTRON], [QUARK], 0),
+    ],
+)
+def test_enumerate_tree_diagrams(incoming, outgoing, count):
+    assert len(enumerate_diagrams(incoming, outgoing, 2, processes=1)) == count
+
+
+def test_enumerate_s_channel():
+    (graph,) = enumerate_diagrams([ELECTRON, ELECTRON], [QUARK, QUARK], 2, processes=1)
+    edges = {
+        (graph.vertices[start], graph.vertices[end], particle)
+        for (start, end), particle in zip(graph.edges, graph.edge_particles)
+    }
+    assert edges == {
+        ("in1", "v1", ELECTRON),
+        ("v1", "in2", ELECTRON),
+        ("v1", "v2", PHOTON),
+        ("v2", "out1", QUARK),
+        ("out2", "v2", QUARK),
+    }
+
+
+def test_enumerated_vertices_are_physical():
+    rules = get_vertex_rules()
+    graphs = enumerate_diagrams([ELECTRON, ELECTRON], [ELECTRON, ELECTRON], 4, processes=1)
+    assert len(graphs) == len(
+        enumerate_diagrams([ELECTRON, ELECTRON], [ELECTRON, ELECTRON], 4, processes=2)
+    )
+    for graph in graphs:
+        for lines in get_vertex_lines(graph).values():
+            assert tuple(sorted(particle for particle, _ in lines)) in rules
+            # A fermion line enters and leaves every vertex it passes through.
+            assert sum(flow for particle, flow in lines if particle in FERMIONS) == 0
+
+
+def test_vertex_rules_need_one_fermion_line():
+    with pytest.raises(Exception):
+        get_vertex_rules([(ELECTRON, QUARK, PHOTON)])
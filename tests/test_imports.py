@@ -0,0 +1,25 @@
+import importlib
+
+import manim
+import pytest
+
+MODULES = [
+    "spectacle",
+    "spectacle.physics.feynman.layout",
+    "spectacle.physics.relativity.causality",
+    "spectacle.physics.relativity.spacetime",
+    "spectacle.manim_extension.mobject.serialization",
+    "spectacle.manim_extension.mobject.svg_export",
+    "spectacle.cli",
+]
+
+
+@pytest.mark.parametrize("name", MODULES)
+def test_import(name):
+    importlib.import_module(name)
+
+
+def test_star_import_keeps_manim_names():
+    namespace = {}
+    exec("from spectacle import *", namespace)
+    assert namespace["Union"] is manim.Union
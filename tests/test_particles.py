@@ -0,0 +1,21 @@
+import pytest
+from spectacle import *
+
+
+@pytest.mark.parametrize("angle", [PI / 3, PI / 2, -PI / 2])
+def test_fermion_matches_arc_between_points(angle):
+    start, end = UP, 2 * LEFT + DOWN
+    arc = ArcBetweenPoints(start, end, angle=angle)
+    line = Line(start=ORIGIN, end=RIGHT).apply_function(lambda p: arc.point_from_proportion(p[0]))
+    fermion = Fermion(start=start, end=end, angle=angle)
+    assert np.allclose(fermion.line.points, line.points, atol=1e-4)
+
+
+@pytest.mark.parametrize("angle", [0, PI / 3, -PI / 2])
+def test_photon_matches_pointwise_warp(angle):
+    start, end = UP, 2 * LEFT + DOWN
+    curve = WavyLine(start=ORIGIN, end=RIGHT, waves=4 * 3, width=0.5).apply_function(
+        lambda p: warp_points_along_arc(p[np.newaxis], start, end, angle=angle)[0]
+    )
+    photon = Photon(start=start, end=end, angle=angle)
+    assert np.allclose(photon.curve.points, curve.points, atol=1e-6)
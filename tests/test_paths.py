@@ -4,3 +4,30 @@ from spectacle import *
 def test__3d():
     p = _3d([1, 1, 0])
     assert p == np.array([1, 1, 0])
+
+
+def test_get_arc_points():
+    points = get_arc_points([0, 0.5, 1], LEFT, RIGHT, angle=PI / 2)
+    assert np.allclose(points[0], LEFT)
+    assert np.allclose(points[1], DOWN * (np.sqrt(2) - 1))
+    assert np.allclose(points[2], RIGHT)
+    assert np.allclose(get_arc_points([0.25], LEFT, RIGHT), LEFT / 2)
+
+
+def test_warp_points_along_arc():
+    points = np.array([[0, 0.1, 0], [0.5, -0.2, 0], [1, 0.1, 0]])
+    warped = warp_points_along_arc(points, LEFT, RIGHT)
+    assert np.allclose(warped, [[-1, 0.1, 0], [0, -0.2, 0], [1, 0.1, 0]])
+
+
+def test_get_wavy_curves_points():
+    points = get_wavy_curves_points(ORIGIN, RIGHT, waves=2, width=0.5)
+    assert points.shape == (8, 3)
+    assert np.allclose(points[:4], get_wavy_curve_points(ORIGIN, RIGHT / 2, width=0.5))
+    assert np.allclose(points[4:], get_wavy_curve_points(RIGHT / 2, RIGHT, width=0.5))
+
+
+def test_place_points_on_chord():
+    points = get_arc_points([0, 0.5, 1], ORIGIN, 2 * RIGHT, angle=PI / 3)
+    placed = place_points_on_chord(points, UP, UP + 2 * LEFT)
+    assert np.allclose(placed, get_arc_points([0, 0.5, 1], UP, UP + 2 * LEFT, angle=PI / 3))
@@ -0,0 +1,52 @@
+from spectacle import *
+
+
+def get_stage_members(animations):
+    return [list(animation.mobject.submobjects) for animation in animations]
+
+
+def test_get_edge_levels_directed():
+    edges = np.array([[0, 1], [1, 2], [3, 2], [2, 4]])
+    assert get_edge_levels(edges).tolist() == [0, 1, 0, 2]
+
+
+def test_get_edge_levels_exchange_waits_for_both_ends():
+    # Two lines 0 -> 1 -> 2 and 3 -> 4 -> 5 exchange a boson between 1 and 4.
+    edges = np.array([[0, 1], [1, 2], [3, 4], [4, 5], [4, 1]])
+    exchanges = np.array([False, False, False, False, True])
+    assert get_edge_levels(edges, exchanges=exchanges).tolist() == [0, 2, 0, 2, 1]
+
+
+def test_get_edge_levels_crossed_exchanges():
+    edges = np.array([[0, 1], [2, 3], [1, 4], [3, 5], [1, 5], [3, 4], [4, 6], [5, 7]])
+    exchanges = np.array([False] * 4 + [True] * 2 + [False] * 2)
+    assert get_edge_levels(edges, exchanges=exchanges).tolist() == [0, 0, 1, 1, 1, 1, 2, 2]
+
+
+def test_two_vertex_layout_stages():
+    layout = TwoVertexLayout(hide_labels=True)
+    assert get_stage_members(layout.interact_animations()) == [
+        layout.incoming_particles,
+        [layout.virtual_particle],
+        layout.outgoing_particles,
+    ]
+
+
+def test_double_interchange_stages():
+    layout = FourVertexLayoutDoubleInterchange(hide_labels=True)
+    assert get_stage_members(layout.interact_animations()) == [
+        layout.movement1,
+        [layout.exchange1],
+        layout.movement2,
+        [layout.exchange2],
+        layout.movement3,
+    ]
+
+
+def test_crossover_interchange_stages():
+    layout = FourVertexLayoutCrossoverInterchange(hide_labels=True)
+    stages = get_stage_members(layout.interact_animations())
+    assert [set(map(id, stage)) for stage in stages] == [
+        set(map(id, movement))
+        for movement in [layout.movement1, layout.movement2, layout.movement3]
+    ]
@@ -0,0 +1,72 @@
+import importlib.util
+import pytest
+from spectacle import *
+from spectacle.manim_extension.mobject import serialization
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(serialization, "get_mobject_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(serialization, "_loaded_mobjects", {})
+    return tmp_path
+
+
+def make_mobject() -> VGroup:
+    line, circle = Line(LEFT, RIGHT, color=RED, stroke_width=6), Circle(fill_opacity=0.5)
+    return VGroup(Square(color=BLUE), VGroup(line, circle))
+
+
+def assert_same_tree(mobject: Mobject, expected: Mobject):
+    members, expected_members = mobject.get_family(), expected.get_family()
+    assert len(members) == len(expected_members)
+    for member, expected_member in zip(members, expected_members):
+        assert np.allclose(member.points, expected_member.points)
+        for name in serialization.STYLE_ARRAYS:
+            assert np.allclose(getattr(member, name), getattr(expected_member, name))
+        for name in serialization.STYLE_VALUES:
+            assert getattr(member, name) == getattr(expected_member, name)
+
+
+def test_serialized_vgroup_round_trip():
+    mobject = make_mobject()
+    structure, points = serialization.serialize_mobject(mobject, [[mobject[0]], mobject[1]])
+    rebuilt = SerializedVGroup(structure, points)
+    assert_same_tree(rebuilt, mobject)
+    assert rebuilt.stages == [[rebuilt[0]], [rebuilt[1][0], rebuilt[1][1]]]
+
+
+def test_save_and_load_mobject():
+    mobject = make_mobject()
+    save_mobject("key", mobject, [[mobject[0]]])
+    serialization._loaded_mobjects.clear()
+    loaded = load_mobject("key")
+    assert_same_tree(loaded, mobject)
+    assert loaded.stages == [[loaded[0]]]
+    assert load_mobject("missing") is None
+
+
+def test_get_cached_mobject_builds_once():
+    built = []
+
+    def build():
+        built.append(make_mobject())
+        return built[-1]
+
+    first = get_cached_mobject(build)
+    serialization._loaded_mobjects.clear()
+    second = get_cached_mobject(build)
+    assert len(built) == 1 and first is built[0]
+    assert isinstance(second, SerializedVGroup)
+    assert_same_tree(second, first)
+
+
+def test_mobject_cache_key_depends_on_builder_source(tmp_path):
+    keys = []
+    for source in ["Square()", "Square(side_length=3)"]:
+        path = tmp_path / "builders.py"
+        path.write_text(f"from manim import Square\n\n\ndef build():\n    return {source}\n")
+        spec = importlib.util.spec_from_file_location("builders", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        keys.append(get_mobject_cache_key(module.build))
+    assert keys[0] != keys[1]
@@ -0,0 +1,137 @@
+import pytest
+from spectacle import *
+
+
+def get_points(mobject):
+    return np.concatenate([member.points for member in mobject.family_members_with_points()])
+
+
+def test_spacetime_axes_round_trip():
+    axes = SpacetimeAxes()
+    rest_points = get_points(axes).copy()
+    axes.apply_lorentz_transformation(0.6).boost(-0.3).apply_lorentz_transformation(0)
+    assert np.allclose(get_points(axes), rest_points)
+
+
+def test_spacetime_axes_keep_added_members():
+    axes = SpacetimeAxes().apply_lorentz_transformation(0.4)
+    dot = Dot(axes.c2p(1, 2))
+    axes.add(dot)
+    axes.apply_lorentz_transformation(-0.3)
+    assert np.allclose(axes.p2c(dot.get_center()), (1, 2))
+    assert np.allclose(axes.x_axis.get_end(), axes.c2p(5, 0))
+
+
+def test_spacetime_axes_follow_parent_transformations():
+    axes = SpacetimeAxes()
+    group = VGroup(axes).scale(0.5).rotate(PI / 6)
+    rest_points = get_points(axes).copy()
+    length = np.linalg.norm(axes.x_axis.get_end() - axes.x_axis.get_start())
+
+    group.shift(UP)
+    axes.apply_lorentz_transformation(0.3)
+    assert np.allclose(axes.c2p(2, 1), NumberPlane.coords_to_point(axes, 2, 1))
+    axes.apply_lorentz_transformation(0)
+    assert np.allclose(get_points(axes), rest_points + UP)
+    assert np.isclose(np.linalg.norm(axes.x_axis.get_end() - axes.x_axis.get_start()), length)
+
+
+def test_worldline_ensemble_boosts_with_its_axes():
+    reference = SpacetimeAxes().scale(0.5).rotate(PI / 6).shift(2 * RIGHT + UP)
+    axes = reference.copy()
+    ensemble = WorldlineEnsemble(axes, [[(0, 0), (0, 2)], [(1, 0), (2, 1)]])
+    rest_points = ensemble.vertices.copy()
+
+    ensemble.apply_lorentz_transformation(0.6)
+    # A worldline at rest moves at the boost velocity afterwards, as the ct axis of the frame.
+    gamma = make_gamma(0.6)
+    assert np.allclose(
+        reference.p2c(ensemble.point_from_member_proportion(0, 1)), (1.2 * gamma, 2 * gamma)
+    )
+    axes.apply_lorentz_transformation(0.6)
+    for index, coords in enumerate([(0, 2), (2, 1)]):
+        assert np.allclose(axes.p2c(ensemble.point_from_member_proportion(index, 1)), coords)
+
+    ensemble.boost(-0.6)
+    assert np.isclose(ensemble.get_rapidity(), 0)
+    assert np.allclose(ensemble.vertices, rest_points)
+
+
+@pytest.fixture
+def spacetime(monkeypatch):
+    # The axis labels need LaTeX, which the projections do not depend on.
+    monkeypatch.setattr(
+        SpacetimeAxes,
+        "get_axis_labels",
+        lambda self, *labels: VGroup(Dot(self.x_axis.get_end()), Dot(self.y_axis.get_end())),
+    )
+    return (
+        Spacetime()
+        .add_worldline_from_coords("main", [0, 0], [3, 5])
+        .add_event_to_worldline("event", "main", 0.4)
+        .add_event_projection("event")
+    )
+
+
+@pytest.mark.parametrize("rapidity", [0.3, -0.5])
+def test_spacetime_projections_follow_rapidity(spacetime, rapidity):
+    spacetime.set_rapidity(rapidity)
+    event_point = spacetime.events["event"].get_center()
+    for index, line in enumerate(spacetime.projections["event"]):
+        expected = spacetime.axes.get_lines_from_axis_to_points(index, [event_point])[0]
+        assert np.allclose(line.get_start(), expected.get_start())
+        assert np.allclose(line.get_end(), expected.get_end())
+        assert line.get_color() == expected.get_color()
+        assert line.get_stroke_width() == expected.get_stroke_width()
+
+
+def test_spacetime_projections_follow_parent_transformations(spacetime):
+    spacetime.set_rapidity(-0.2)
+    VGroup(spacetime).scale(0.5).rotate(0.3)
+    spacetime.set_rapidity(0.4)
+    event_point = spacetime.events["event"].get_center()
+    for index, line in enumerate(spacetime.projections["event"]):
+        assert np.allclose(line.get_start(), spacetime.axes.get_axis_points(index, event_point))
+        assert np.allclose(line.get_end(), event_point)
+
+
+def get_hyperbolic_coords(acceleration: float, proper_times: np.ndarray) -> np.ndarray:
+    return np.stack(
+        [
+            (np.cosh(acceleration * proper_times) - 1) / acceleration,
+            np.sinh(acceleration * proper_times) / acceleration,
+        ],
+        axis=1,
+    )
+
+
+def test_get_proper_times_of_uniform_acceleration():
+    proper_times = np.linspace(0, 2, 2001)
+    integrated = get_proper_times(get_hyperbolic_coords(1.5, proper_times))
+    assert np.allclose(integrated, proper_times, atol=1e-5)
+    assert np.allclose(get_proper_times([[0, 0], [0.6, 1]]), [0, 0.8])
+    with pytest.raises(FTLError):
+        get_proper_times([[0, 0], [2, 1]])
+
+
+def test_proper_time_worldline_points():
+    axes = SpacetimeAxes()
+    proper_times = np.linspace(0, 2, 2001)
+    worldline = ProperTimeWorldline(axes, get_hyperbolic_coords(1.5, proper_times))
+    queries = np.array([0, 0.25, 1.3, 2])
+    expected = axes.coords_to_points(get_hyperbolic_coords(1.5, queries))
+    assert np.isclose(worldline.get_proper_time(), 2, atol=1e-5)
+    assert np.allclose(worldline.points_at_proper_times(queries), expected, atol=1e-4)
+    assert np.allclose(worldline.point_at_proper_time(5), expected[-1])
+
+
+def test_spacetime_events_at_proper_times(spacetime):
+    spacetime.add_accelerated_worldline("rocket", 0.8, (0, 3), start_coord=(1, 0))
+    spacetime.add_events_at_proper_times(["a", "b"], "rocket", [1, 2.5])
+    expected = get_hyperbolic_coords(0.8, np.array([1, 2.5])) + (1, 0)
+    for name, coords in zip(["a", "b"], expected):
+        assert np.allclose(
+            spacetime.axes.p2c(spacetime.events[name].get_center()), coords, atol=1e-3
+        )
+    with pytest.raises(Exception):
+        spacetime.add_event_at_proper_time("c", "main", 1)
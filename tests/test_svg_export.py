@@ -0,0 +1,41 @@
+import xml.etree.ElementTree as ElementTree
+from spectacle import *
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def get_path_points(path_data: str) -> np.ndarray:
+    values = [float(value) for value in path_data.split() if value not in ["M", "C", "Z"]]
+    return np.array(values).reshape(-1, 2)
+
+
+def test_mobject_to_svg():
+    square = Square(2, color=BLUE, fill_opacity=0.5)
+    line = Line(LEFT, RIGHT + UP, color=RED, stroke_width=8)
+    root = ElementTree.fromstring(mobject_to_svg(VGroup(square, line), buff=0.25))
+    assert root.get("viewBox") == "-1.25 -1.25 2.5 2.5"
+    assert root.get("width") == "250"
+
+    square_path, line_path = root.findall(f"{SVG}path")
+    assert len(root.findall(f"{SVG}path")) == 2
+    assert square_path.get("fill") == rgb_to_hex(square.get_fill_rgbas()[0, :3])
+    assert square_path.get("fill-opacity") == "0.5"
+    assert square_path.get("stroke-width") == "0.04"
+    assert square_path.get("d").endswith("Z")
+    assert line_path.get("fill") == "none"
+    assert line_path.get("stroke") == rgb_to_hex(line.get_stroke_rgbas()[0, :3])
+    assert line_path.get("stroke-width") == "0.08"
+
+    square_points = square.points.reshape(-1, 4, 3)
+    expected = np.concatenate([square_points[:1, 0], square_points[:, 1:].reshape(-1, 3)])
+    assert np.allclose(get_path_points(square_path.get("d")), expected[:, :2] * [1, -1], atol=1e-3)
+    assert np.allclose(
+        get_path_points(line_path.get("d")), line.points[:, :2] * [1, -1], atol=1e-3
+    )
+
+
+def test_mobject_to_svg_splits_subpaths():
+    mobject = VMobject().set_points(np.concatenate([Line(LEFT, ORIGIN).points, Square().points]))
+    path_data = ElementTree.fromstring(mobject_to_svg(mobject)).find(f"{SVG}path").get("d")
+    assert path_data.count("M") == 2
+    assert path_data.count("Z") == 1
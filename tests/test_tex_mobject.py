@@ -0,0 +1,64 @@
+import pytest
+from spectacle import *
+from spectacle.manim_extension.mobject import tex_mobject
+
+
+def make_row(tex_string: str, y=0.0) -> VGroup:
+    glyphs = [c for c in tex_string if not c.isspace()]
+    return VGroup(*[Square(0.2).move_to([0.3 * i, y, 0]) for i in range(len(glyphs))])
+
+
+@pytest.fixture
+def compiled(monkeypatch, tmp_path):
+    """Replaces LaTeX with one square per character and records every compiled string."""
+    compiled = []
+
+    def fake_math_tex(*tex_strings, **kwargs):
+        compiled.append(tex_strings)
+        return VGroup(*[make_row(tex_string) for tex_string in tex_strings]).center()
+
+    def fake_single_string_math_tex(tex_string, **kwargs):
+        compiled.append((tex_string,))
+        rows = tex_string.split(r" \\[4em] ")
+        return VGroup(*[make_row(row, y=-2.5 * i) for i, row in enumerate(rows)]).center()
+
+    monkeypatch.setattr(tex_mobject, "get_tex_glyph_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(tex_mobject, "_loaded_tex_glyphs", {})
+    monkeypatch.setattr(tex_mobject, "MathTex", fake_math_tex)
+    monkeypatch.setattr(tex_mobject, "SingleStringMathTex", fake_single_string_math_tex)
+    return compiled
+
+
+def test_cached_math_tex_reads_disk_cache(compiled, tmp_path):
+    first = CachedMathTex("e^-", "q")
+    tex_mobject._loaded_tex_glyphs.clear()
+    second = CachedMathTex("e^-", "q")
+    assert compiled == [("e^-", "q")]
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+    assert np.allclose(second.get_all_points(), first.get_all_points())
+
+
+def test_tex_glyph_key_depends_on_compiler():
+    template = TexTemplate()
+    key = tex_mobject.get_tex_glyph_key(["g"], tex_template=template)
+    template.tex_compiler = "xelatex"
+    assert tex_mobject.get_tex_glyph_key(["g"], tex_template=template) != key
+
+
+def get_row_sizes(*tex_strings):
+    return [[len(part) for part in tex_mobject.get_tex_glyphs([s])] for s in tex_strings]
+
+
+def test_precompile_tex_splits_rows(compiled):
+    precompile_tex("e^-", "q", "gg")
+    assert get_row_sizes("e^-", "q", "gg") == [[3], [1], [2]]
+    assert len(compiled) == 1
+    assert np.allclose(
+        CachedMathTex("gg").get_all_points(), make_row("gg").center().get_all_points()
+    )
+
+
+def test_precompile_tex_with_empty_label(compiled):
+    precompile_tex("e^-", "", "gg")
+    assert get_row_sizes("e^-", "", "gg") == [[3], [0], [2]]
+    assert ("",) in compiled